@@ -14,7 +14,7 @@ import logging
 from datetime import datetime
 
 # Import our custom modules
-from config import Config
+from config import Config, validate_config
 from database import get_db, init_db
 from caching.redis_cache import get_cache
 from api_docs.swagger import setup_swagger
@@ -358,6 +358,15 @@ def create_app(config_class=Config):
 
 def main():
     """Main application entry point"""
+    # Fail fast on configuration problems before any component is initialized
+    config_errors, config_warnings = validate_config(Config)
+    for warning in config_warnings:
+        logger.warning(f"⚠️ Configuration: {warning}")
+    if config_errors:
+        for error in config_errors:
+            logger.error(f"❌ Configuration: {error}")
+        sys.exit(1)
+
     app = create_app()
 
     # SSL configuration (if certificates exist)
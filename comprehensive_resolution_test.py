@@ -9,16 +9,12 @@ import os
 import logging
 from datetime import datetime
 
-# Set up logging to file
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    filename='resolution_test.log',
-    filemode='w'
-)
+from harness_support import queued_logging
 
 def test_resolution_management():
     """Test the resolution management functionality."""
+    if hasattr(sys.stdout, "reconfigure"):
+        sys.stdout.reconfigure(line_buffering=False, write_through=False)
     print("Starting comprehensive resolution management test...")
     logging.info("Starting comprehensive resolution management test")
     
@@ -97,9 +93,19 @@ def test_resolution_management():
         logging.error(f"Test failed with error: {e}")
         print(f"Test failed: {e}")
         return False
+    finally:
+        sys.stdout.flush()
     
     return True
 
+def main():
+    """Run the resolution test with its log written to resolution_test.log."""
+    file_handler = logging.FileHandler('resolution_test.log', mode='w')
+    file_handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
+    # A background listener does the file writes; it is drained on exit
+    with queued_logging(file_handler):
+        return test_resolution_management()
+
 if __name__ == "__main__":
-    success = test_resolution_management()
+    success = main()
     sys.exit(0 if success else 1)
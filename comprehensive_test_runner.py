@@ -15,58 +15,111 @@ Usage:
     python comprehensive_test_runner.py coverage
 """
 
+import shlex
 import subprocess
 import sys
+import importlib.util
 import logging
 import json
 import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s %(levelname)s: %(message)s')
 
-def run_command(command, check=True):
-    logging.info(f"Running command: {command}")
-    result = subprocess.run(command, shell=True, capture_output=True, text=True)
-    if result.stdout:
-        logging.info(f"Output: {result.stdout.strip()}")
+# Upper bound for a single suite so one hung process cannot stall the whole run
+SUITE_TIMEOUT_SECONDS = 1800
+
+def run_command(argv, check=True, timeout=SUITE_TIMEOUT_SECONDS):
+    """Run argv directly (no intermediate shell) and report whether it succeeded."""
+    info_enabled = logging.getLogger().isEnabledFor(logging.INFO)
+    if info_enabled:
+        logging.info("Running command: %s", shlex.join(argv))
+    try:
+        result = subprocess.run(argv, capture_output=True, text=True, timeout=timeout,
+                                stdin=subprocess.DEVNULL)
+    except subprocess.TimeoutExpired:
+        logging.error("Command timed out after %ss", timeout)
+        return False
+    if result.stdout and info_enabled:
+        logging.info("Output: %s", result.stdout.strip())
     if result.stderr:
-        logging.error(f"Error: {result.stderr.strip()}")
+        logging.error("Error: %s", result.stderr.strip())
     if check and result.returncode != 0:
-        logging.error(f"Command failed with exit code {result.returncode}")
+        logging.error("Command failed with exit code %s", result.returncode)
         return False
     return True
 
+def xdist_args():
+    """pytest-xdist arguments, leaving one core for each suite running alongside the unit tests."""
+    if not importlib.util.find_spec("xdist"):
+        return []
+    workers = (os.cpu_count() or 1) - len(PARALLEL_SUITES)
+    if workers < 2:
+        return []
+    # loadfile keeps each test module (and its setUpClass state) on a single worker
+    return ["-n", str(workers), "--dist=loadfile"]
+
 def run_unit_tests():
     logging.info("Running unit tests...")
-    return run_command("python -m pytest tests/ -v --tb=short")
+    return run_command([sys.executable, "-m", "pytest", "tests/", "-v", "--tb=short", *xdist_args()])
 
 def run_integration_tests():
     logging.info("Running integration tests...")
-    return run_command("python test_integration.py")
+    return run_command([sys.executable, "test_integration.py"])
 
 def run_performance_tests():
     logging.info("Running performance tests...")
-    return run_command("python test_performance.py")
+    return run_command([sys.executable, "test_performance.py"])
 
 def run_security_tests():
     logging.info("Running security tests...")
-    return run_command("python -m pytest tests/test_security.py -v")
+    return run_command([sys.executable, "-m", "pytest", "tests/test_security.py", "-v"])
 
 def run_e2e_tests():
     logging.info("Running end-to-end tests...")
-    return run_command("python e2e_test_suite.py")
+    return run_command([sys.executable, "e2e_test_suite.py"])
 
 def run_nvidia_tests():
     logging.info("Running NVIDIA integration tests...")
-    return run_command("python test_nvidia_integration_fixed.py")
+    return run_command([sys.executable, "test_nvidia_integration_fixed.py"])
 
 def run_financial_tests():
     logging.info("Running financial system tests...")
-    return run_command("python test_financial_system.py")
+    return run_command([sys.executable, "test_financial_system.py"])
 
 def generate_coverage_report():
     logging.info("Generating coverage report...")
-    return run_command("python -m pytest --cov=. --cov-report=html --cov-report=term")
+    return run_command([sys.executable, "-m", "pytest", "--cov=.", "--cov-report=html", "--cov-report=term"])
+
+TEST_SUITES = {
+    "unit_tests": run_unit_tests,
+    "integration_tests": run_integration_tests,
+    "performance_tests": run_performance_tests,
+    "security_tests": run_security_tests,
+    "e2e_tests": run_e2e_tests,
+    "nvidia_tests": run_nvidia_tests,
+    "financial_tests": run_financial_tests,
+}
+
+# Suites that bind localhost:5000 (e2e) or write sqlite:///revenue.db in the
+# working directory (RevenueTracker/AdvancedRevenueTracker defaults); they run
+# one at a time. The remaining suites share no ports or files.
+SERIAL_SUITES = ("unit_tests", "integration_tests", "e2e_tests", "financial_tests")
+PARALLEL_SUITES = tuple(name for name in TEST_SUITES if name not in SERIAL_SUITES)
+
+def _run_serially(names):
+    return {name: TEST_SUITES[name]() for name in names}
+
+def run_test_suites():
+    """Run the state-sharing suites in sequence, alongside the independent ones."""
+    with ThreadPoolExecutor(max_workers=1 + len(PARALLEL_SUITES)) as executor:
+        serial = executor.submit(_run_serially, SERIAL_SUITES)
+        parallel = {name: executor.submit(TEST_SUITES[name]) for name in PARALLEL_SUITES}
+        results = serial.result()
+        results.update((name, future.result()) for name, future in parallel.items())
+    # Report in declaration order
+    return {name: results[name] for name in TEST_SUITES}
 
 def generate_test_report():
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -74,21 +127,13 @@ def generate_test_report():
 
     test_results = {
         "timestamp": timestamp,
-        "test_suites": {
-            "unit_tests": run_unit_tests(),
-            "integration_tests": run_integration_tests(),
-            "performance_tests": run_performance_tests(),
-            "security_tests": run_security_tests(),
-            "e2e_tests": run_e2e_tests(),
-            "nvidia_tests": run_nvidia_tests(),
-            "financial_tests": run_financial_tests()
-        }
+        "test_suites": run_test_suites()
     }
 
     with open(report_file, 'w') as f:
         json.dump(test_results, f, indent=2)
 
-    logging.info(f"Test report saved to {report_file}")
+    logging.info("Test report saved to %s", report_file)
     return test_results
 
 def main():
@@ -103,14 +148,14 @@ def main():
         results = generate_test_report()
         passed = sum(1 for result in results["test_suites"].values() if result)
         total = len(results["test_suites"])
-        logging.info(f"Test Results: {passed}/{total} test suites passed")
+        logging.info("Test Results: %s/%s test suites passed", passed, total)
     elif command == "report":
         results = generate_test_report()
         logging.info("Test report generated successfully.")
     elif command == "coverage":
         generate_coverage_report()
     else:
-        logging.error(f"Unknown command: {command}")
+        logging.error("Unknown command: %s", command)
         sys.exit(1)
 
 if __name__ == "__main__":
@@ -7,14 +7,19 @@ import os
 import sys
 import json
 import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from datetime import datetime, timedelta
 from financial_analytics_engine import AdvancedRevenueTracker, RevenueCategory
 
+# Each test gets a fresh in-memory database unless a URL is supplied; test
+# databases are disposable, so on-disk ones skip per-commit fsyncs
+TEST_DB_URL = os.getenv("REVENUE_TEST_DB_URL", "sqlite://")
+
 def test_database_integration():
     """Test full database integration"""
     print("🔍 Testing Database Integration...")
 
-    tracker = AdvancedRevenueTracker()
+    tracker = AdvancedRevenueTracker(TEST_DB_URL, relaxed_durability=True)
 
     # Test adding multiple records
     records = [
@@ -53,16 +58,15 @@ def test_ai_features():
     """Test AI-powered features"""
     print("🤖 Testing AI-Powered Features...")
 
-    tracker = AdvancedRevenueTracker()
+    tracker = AdvancedRevenueTracker(TEST_DB_URL, relaxed_durability=True)
 
     # Add historical data for AI training
     base_date = datetime.utcnow() - timedelta(days=60)
-    for i in range(60):
-        date = base_date + timedelta(days=i)
-        amount = 1000 + (i * 10) + (i % 7 * 50)  # Some pattern with weekly variation
-        tracker.add_record(f"Daily Revenue {i+1}", amount, RevenueCategory.SALES, date=date)
-
-    historical_data = [record.to_dict() for record in tracker.get_all_records()]
+    tracker.add_records_bulk([
+        # Some pattern with weekly variation
+        (f"Daily Revenue {i+1}", 1000 + (i * 10) + (i % 7 * 50), RevenueCategory.SALES, base_date + timedelta(days=i))
+        for i in range(60)
+    ])
 
     # Test AI forecasting
     forecast_result = tracker.ai_powered_forecasting(days_ahead=30)
@@ -87,7 +91,7 @@ def test_comprehensive_kpis():
     """Test comprehensive KPI calculations"""
     print("📊 Testing Comprehensive KPI Calculations...")
 
-    tracker = AdvancedRevenueTracker()
+    tracker = AdvancedRevenueTracker(TEST_DB_URL, relaxed_durability=True)
 
     # Add test data across different periods
     now = datetime.utcnow()
@@ -115,7 +119,7 @@ def test_comprehensive_kpis():
 
     print(f"  ✅ Current Revenue: ${kpis['current_period_revenue']:.2f}")
     print(f"  ✅ Growth Rate: {kpis['growth_rate']:.2f}%")
-    print(f"  ✅ Categories: {list(kpis['category_breakdown'].keys())}")
+    print(f"  ✅ Categories: {list(kpis['category_breakdown'])}")
     print(f"  ✅ Category Growth Rates: {kpis['category_growth_rates']}")
 
     # Verify no None categories in breakdown
@@ -128,7 +132,7 @@ def test_reporting_and_alerts():
     """Test reporting and alert generation"""
     print("📋 Testing Reporting and Alert Generation...")
 
-    tracker = AdvancedRevenueTracker()
+    tracker = AdvancedRevenueTracker(TEST_DB_URL, relaxed_durability=True)
 
     # Add data that should trigger alerts
     for i in range(5):
@@ -172,7 +176,7 @@ def test_edge_cases():
     """Test edge cases and error handling"""
     print("🔧 Testing Edge Cases and Error Handling...")
 
-    tracker = AdvancedRevenueTracker()
+    tracker = AdvancedRevenueTracker(TEST_DB_URL, relaxed_durability=True)
 
     # Test empty data scenarios
     empty_kpis = tracker.calculate_comprehensive_kpis()
@@ -188,7 +192,7 @@ def test_edge_cases():
     # Test invalid category names (should be handled gracefully)
     # This tests the _get_category_enum method
     from financial_analytics_engine import AdvancedRevenueTracker
-    tracker_instance = AdvancedRevenueTracker()
+    tracker_instance = AdvancedRevenueTracker(TEST_DB_URL, relaxed_durability=True)
 
     # Test the helper method directly
     result = tracker_instance._get_category_enum("InvalidCategory")
@@ -210,17 +214,23 @@ def test_performance():
     """Test performance under realistic data loads"""
     print("⚡ Testing Performance Under Load...")
 
-    tracker = AdvancedRevenueTracker()
+    tracker = AdvancedRevenueTracker(TEST_DB_URL, relaxed_durability=True)
 
     # Add realistic volume of data (1000 records)
     print("    Adding 1000 test records...")
     start_time = time.time()
 
+    now = datetime.utcnow()
+    dates = [now - timedelta(days=offset) for offset in range(365)]
+    categories = tuple(RevenueCategory)
+    category_count = len(categories)
+    rows = []
     for i in range(1000):
         amount = 500 + (i % 100 * 10)  # Varied amounts
-        category = list(RevenueCategory)[i % len(RevenueCategory)]
-        date = datetime.utcnow() - timedelta(days=i % 365)
-        tracker.add_record(f"Performance Test Record {i+1}", amount, category, date=date)
+        category = categories[i % category_count]
+        date = dates[i % 365]
+        rows.append((f"Performance Test Record {i+1}", amount, category, date))
+    tracker.add_records_bulk(rows)
 
     data_insertion_time = time.time() - start_time
     print(".2f")
@@ -249,60 +259,35 @@ def test_performance():
 
     print("  ✅ Performance tests passed")
 
+TESTS = [
+    ("Database Integration", test_database_integration),
+    ("AI Features", test_ai_features),
+    ("Comprehensive KPIs", test_comprehensive_kpis),
+    ("Reporting and Alerts", test_reporting_and_alerts),
+    ("Edge Cases", test_edge_cases),
+    ("Performance", test_performance),
+]
+
 def run_all_tests():
     """Run all comprehensive tests"""
     print("🚀 Starting Comprehensive Financial Analytics Engine Tests")
     print("=" * 60)
 
-    test_results = []
-
-    try:
-        # Test 1: Database Integration
-        test_database_integration()
-        test_results.append(("Database Integration", "PASSED"))
-    except Exception as e:
-        print(f"❌ Database Integration failed: {e}")
-        test_results.append(("Database Integration", f"FAILED: {e}"))
-
-    try:
-        # Test 2: AI Features
-        test_ai_features()
-        test_results.append(("AI Features", "PASSED"))
-    except Exception as e:
-        print(f"❌ AI Features failed: {e}")
-        test_results.append(("AI Features", f"FAILED: {e}"))
-
-    try:
-        # Test 3: Comprehensive KPIs
-        test_comprehensive_kpis()
-        test_results.append(("Comprehensive KPIs", "PASSED"))
-    except Exception as e:
-        print(f"❌ Comprehensive KPIs failed: {e}")
-        test_results.append(("Comprehensive KPIs", f"FAILED: {e}"))
-
-    try:
-        # Test 4: Reporting and Alerts
-        test_reporting_and_alerts()
-        test_results.append(("Reporting and Alerts", "PASSED"))
-    except Exception as e:
-        print(f"❌ Reporting and Alerts failed: {e}")
-        test_results.append(("Reporting and Alerts", f"FAILED: {e}"))
-
-    try:
-        # Test 5: Edge Cases
-        test_edge_cases()
-        test_results.append(("Edge Cases", "PASSED"))
-    except Exception as e:
-        print(f"❌ Edge Cases failed: {e}")
-        test_results.append(("Edge Cases", f"FAILED: {e}"))
-
-    try:
-        # Test 6: Performance
-        test_performance()
-        test_results.append(("Performance", "PASSED"))
-    except Exception as e:
-        print(f"❌ Performance failed: {e}")
-        test_results.append(("Performance", f"FAILED: {e}"))
+    # Each test builds its own tracker on a private database, so they run in separate processes
+    outcomes = {}
+    with ProcessPoolExecutor(max_workers=min(len(TESTS), os.cpu_count() or 1)) as executor:
+        futures = {executor.submit(test_func): test_name for test_name, test_func in TESTS}
+        for future in as_completed(futures):
+            test_name = futures[future]
+            try:
+                future.result()
+                outcomes[test_name] = "PASSED"
+            except Exception as e:
+                print(f"❌ {test_name} failed: {e}")
+                outcomes[test_name] = f"FAILED: {e}"
+
+    # Report in declaration order regardless of completion order
+    test_results = [(test_name, outcomes[test_name]) for test_name, _ in TESTS]
 
     # Summary
     print("\n" + "=" * 60)
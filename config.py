@@ -3,6 +3,11 @@ Configuration settings for Owlban Group Integrated Platform
 """
 
 import os
+import sys
+import logging
+from functools import lru_cache
+from pathlib import Path
+from urllib.parse import urlsplit
 
 class Config:
     # Database URL for SQLAlchemy
@@ -25,8 +30,8 @@ class Config:
     # OSCAR BROOME URL for payment and overrides proxy
     OSCAR_BROOME_URL = os.getenv('OSCAR_BROOME_URL', 'http://localhost:4000')
 
-    # Flask environment
-    FLASK_ENV = os.getenv('FLASK_ENV', 'development')
+    # Flask environment (interned: compared against a few known names)
+    FLASK_ENV = sys.intern(os.getenv('FLASK_ENV', 'development'))
 
     # Debug mode
     DEBUG = FLASK_ENV == 'development'
@@ -35,7 +40,60 @@ class Config:
     SSL_CERT_PATH = os.getenv('SSL_CERT_PATH', '')
     SSL_KEY_PATH = os.getenv('SSL_KEY_PATH', '')
 
-    # Logging configuration
-    LOG_LEVEL = os.getenv('LOG_LEVEL', 'INFO')
+    # Logging configuration (interned: used as a level-name lookup key)
+    LOG_LEVEL = sys.intern(os.getenv('LOG_LEVEL', 'INFO'))
+
+    # Treat configuration warnings as startup errors
+    CONFIG_VALIDATE_STRICT = os.getenv('CONFIG_VALIDATE_STRICT', 'false').lower() == 'true'
 
     # Other configurations can be added here as needed
+
+
+@lru_cache(maxsize=None)
+def validate_config(config_class=Config):
+    """
+    Check configuration values, collecting every problem rather than stopping at the first
+
+    Results are cached per configuration class, so repeated calls (e.g. from
+    health checks) do not stat the SSL files again; call
+    validate_config.cache_clear() after changing settings.
+
+    Args:
+        config_class: Configuration class to check
+
+    Returns:
+        Tuple of (errors, warnings), each a tuple of messages. Errors are settings the application cannot
+        start with; warnings are promoted to errors when CONFIG_VALIDATE_STRICT is set.
+    """
+    errors = []
+    warnings = []
+
+    database_url = urlsplit(config_class.SQLALCHEMY_DATABASE_URI)
+    if not database_url.scheme:
+        errors.append("DATABASE_URL has no scheme")
+    try:
+        database_url.port
+    except ValueError:
+        errors.append("DATABASE_URL has an invalid port")
+
+    if config_class.JWT_ACCESS_TOKEN_EXPIRES <= 0:
+        errors.append("JWT_ACCESS_TOKEN_EXPIRES must be a positive number of seconds")
+
+    if not isinstance(logging.getLevelName(config_class.LOG_LEVEL.upper()), int):
+        errors.append(f"LOG_LEVEL {config_class.LOG_LEVEL!r} is not a logging level")
+
+    for name in ('SSL_CERT_PATH', 'SSL_KEY_PATH'):
+        path = getattr(config_class, name)
+        if path and not Path(path).is_file():
+            errors.append(f"{name} points to a missing file: {path}")
+
+    if not config_class.NVIDIA_API_KEY:
+        warnings.append("NVIDIA_API_KEY is not set; NVIDIA features will be unavailable")
+    if not config_class.DEBUG and config_class.SECRET_KEY == 'supersecretkey':
+        warnings.append("SECRET_KEY is using the built-in default outside development")
+
+    if config_class.CONFIG_VALIDATE_STRICT:
+        errors.extend(warnings)
+        warnings = []
+
+    return tuple(errors), tuple(warnings)
@@ -8,24 +8,66 @@ This script performs essential validation of core functionality.
 import sys
 import os
 import json
-import time
-import requests
-import subprocess
-import threading
+import importlib
 from unittest.mock import patch, Mock
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Decode response bodies straight from bytes when orjson is installed
+_loads = orjson.loads if ORJSON_AVAILABLE else json.loads
+
 # Add current directory to path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
+# Modules imported on first use, so selecting a single test only pays for
+# the Flask/psutil stack when that test actually needs it
+_MODULE_CACHE = {}
+
+def _integration():
+    """Return the integration module, importing it on first use."""
+    module = _MODULE_CACHE.get('nvidia_oscar_broome_integration')
+    if module is None:
+        module = importlib.import_module('nvidia_oscar_broome_integration')
+        _MODULE_CACHE['nvidia_oscar_broome_integration'] = module
+    return module
+
+def _client():
+    """Return a test client shared by all endpoint tests, created on first use."""
+    client = _MODULE_CACHE.get('test_client')
+    if client is None:
+        client = _integration().app.test_client()
+        client.testing = True
+        _MODULE_CACHE['test_client'] = client
+    return client
+
+_REQUIRED_REQUIREMENT_KEYS = frozenset({
+    'min_driver_version',
+    'recommended_driver_version',
+    'min_cuda_version',
+    'recommended_cuda_version',
+    'min_vram',
+    'recommended_vram'
+})
+
+# Canned collector inputs, built once and shared by the metric collection tests
+_GPU_STDOUT = "0, NVIDIA GeForce RTX 3080, 75, 10240, 8192, 65, 470.00\n"
+_GPU_RUN_RESULT = Mock(stdout=_GPU_STDOUT, stderr="", returncode=0)
+_VIRTUAL_MEMORY = Mock(total=17179869184, used=8589934592, percent=50.0)
+_DISK_USAGE = Mock(total=1000000000000, used=500000000000, percent=50.0)
+_NET_IO_COUNTERS = Mock(bytes_sent=1000000, bytes_recv=2000000)
+
 def test_critical_imports():
     """Test critical module imports."""
     print("🔍 Testing critical imports...")
     try:
-        from nvidia_oscar_broome_integration import (
-            NVIDIAMonitor,
-            app,
-            NVIDIA_REQUIREMENTS
-        )
+        integration = _integration()
+        for name in ('NVIDIAMonitor', 'app', 'NVIDIA_REQUIREMENTS'):
+            if not hasattr(integration, name):
+                raise ImportError(f"cannot import name '{name}'")
         print("✅ Critical imports successful")
         return True
     except ImportError as e:
@@ -36,7 +78,7 @@ def test_monitor_initialization():
     """Test NVIDIA monitor initialization."""
     print("🔍 Testing monitor initialization...")
     try:
-        from nvidia_oscar_broome_integration import NVIDIAMonitor
+        NVIDIAMonitor = _integration().NVIDIAMonitor
         monitor = NVIDIAMonitor()
 
         # Check initial state
@@ -55,7 +97,7 @@ def test_flask_app_creation():
     """Test Flask application creation."""
     print("🔍 Testing Flask application creation...")
     try:
-        from nvidia_oscar_broome_integration import app
+        app = _integration().app
 
         # Test that app is created
         assert app is not None
@@ -72,15 +114,12 @@ def test_health_endpoint():
     """Test health endpoint functionality."""
     print("🔍 Testing health endpoint...")
     try:
-        from nvidia_oscar_broome_integration import app
-
-        client = app.test_client()
-        client.testing = True
+        client = _client()
 
         response = client.get('/api/health')
         assert response.status_code == 200
 
-        data = json.loads(response.data)
+        data = _loads(response.data)
         assert data['status'] == 'healthy'
 
         print("✅ Health endpoint test successful")
@@ -93,15 +132,12 @@ def test_system_info_endpoint():
     """Test system info endpoint functionality."""
     print("🔍 Testing system info endpoint...")
     try:
-        from nvidia_oscar_broome_integration import app
-
-        client = app.test_client()
-        client.testing = True
+        client = _client()
 
         response = client.get('/api/system/info')
         assert response.status_code == 200
 
-        data = json.loads(response.data)
+        data = _loads(response.data)
         assert 'timestamp' in data
 
         print("✅ System info endpoint test successful")
@@ -114,10 +150,7 @@ def test_dashboard_rendering():
     """Test dashboard HTML rendering."""
     print("🔍 Testing dashboard rendering...")
     try:
-        from nvidia_oscar_broome_integration import app
-
-        client = app.test_client()
-        client.testing = True
+        client = _client()
 
         response = client.get('/')
         assert response.status_code == 200
@@ -136,7 +169,9 @@ def test_gpu_data_collection():
     """Test GPU data collection (mocked)."""
     print("🔍 Testing GPU data collection...")
     try:
-        from nvidia_oscar_broome_integration import NVIDIAMonitor, gpu_monitoring_data
+        integration = _integration()
+        NVIDIAMonitor = integration.NVIDIAMonitor
+        gpu_monitoring_data = integration.gpu_monitoring_data
 
         monitor = NVIDIAMonitor()
 
@@ -144,12 +179,7 @@ def test_gpu_data_collection():
         gpu_monitoring_data.clear()
 
         # Mock nvidia-smi command
-        mock_result = Mock()
-        mock_result.stdout = "0, NVIDIA GeForce RTX 3080, 75, 10240, 8192, 65, 470.00\n"
-        mock_result.stderr = ""
-        mock_result.returncode = 0
-
-        with patch('subprocess.run', return_value=mock_result):
+        with patch('subprocess.run', return_value=_GPU_RUN_RESULT):
             monitor._collect_gpu_data()
 
         # Check that data was collected in global variable
@@ -170,15 +200,15 @@ def test_system_metrics_collection():
     """Test system metrics collection."""
     print("🔍 Testing system metrics collection...")
     try:
-        from nvidia_oscar_broome_integration import NVIDIAMonitor
+        NVIDIAMonitor = _integration().NVIDIAMonitor
 
         monitor = NVIDIAMonitor()
 
         # Mock psutil functions
         with patch('psutil.cpu_percent', return_value=45.5), \
-             patch('psutil.virtual_memory', return_value=Mock(total=17179869184, used=8589934592, percent=50.0)), \
-             patch('psutil.disk_usage', return_value=Mock(total=1000000000000, used=500000000000, percent=50.0)), \
-             patch('psutil.net_io_counters', return_value=Mock(bytes_sent=1000000, bytes_recv=2000000)):
+             patch('psutil.virtual_memory', return_value=_VIRTUAL_MEMORY), \
+             patch('psutil.disk_usage', return_value=_DISK_USAGE), \
+             patch('psutil.net_io_counters', return_value=_NET_IO_COUNTERS):
 
             monitor._collect_system_metrics()
 
@@ -197,19 +227,10 @@ def test_nvidia_requirements():
     """Test NVIDIA requirements structure."""
     print("🔍 Testing NVIDIA requirements...")
     try:
-        from nvidia_oscar_broome_integration import NVIDIA_REQUIREMENTS
-
-        required_keys = [
-            'min_driver_version',
-            'recommended_driver_version',
-            'min_cuda_version',
-            'recommended_cuda_version',
-            'min_vram',
-            'recommended_vram'
-        ]
+        NVIDIA_REQUIREMENTS = _integration().NVIDIA_REQUIREMENTS
 
-        for key in required_keys:
-            assert key in NVIDIA_REQUIREMENTS
+        missing = _REQUIRED_REQUIREMENT_KEYS - NVIDIA_REQUIREMENTS.keys()
+        assert not missing, f"missing requirement keys: {sorted(missing)}"
 
         print("✅ NVIDIA requirements test successful")
         return True
@@ -238,9 +259,16 @@ def run_critical_path_tests():
 
     passed = 0
     failed = 0
+    skipped = 0
     results = []
 
     for test in critical_tests:
+        # Every later test imports the integration module; once that import
+        # has failed they can only fail the same way, so skip them
+        if results and results[0] == (test_critical_imports.__name__, False):
+            results.append((test.__name__, None))
+            skipped += 1
+            continue
         try:
             result = test()
             results.append((test.__name__, result))
@@ -253,15 +281,18 @@ def run_critical_path_tests():
             results.append((test.__name__, False))
             failed += 1
 
+    if skipped:
+        print(f"⏭️  Skipped {skipped} test(s): core imports failed")
+
     print("\n" + "=" * 60)
     print("CRITICAL PATH TEST RESULTS")
     print("=" * 60)
 
     for test_name, result in results:
-        status = "✅ PASS" if result else "❌ FAIL"
+        status = "⏭️  SKIP" if result is None else "✅ PASS" if result else "❌ FAIL"
         print(f"{status} - {test_name}")
 
-    print(f"\n📊 SUMMARY: {passed} passed, {failed} failed")
+    print(f"\n📊 SUMMARY: {passed} passed, {failed} failed, {skipped} skipped")
 
     if failed == 0:
         print("\n🎉 ALL CRITICAL PATH TESTS PASSED!")
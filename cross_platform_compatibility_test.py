@@ -5,69 +5,93 @@ Tests the system's behavior across different simulated environments.
 """
 
 import sys
+import functools
 import os
 import logging
 import platform
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 
-# Set up logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    filename='cross_platform_compatibility_test.log',
-    filemode='w'
-)
+from harness_support import PerThreadStdout, run_captured, queued_logging
+
+class _CurrentStdout:
+    """Stream that writes to whatever sys.stdout is at the time of the call."""
+
+    def write(self, text):
+        return sys.stdout.write(text)
+
+    def flush(self):
+        sys.stdout.flush()
+
+# Test progress goes through one logger: the console handler echoes each
+# record on the calling thread and the record propagates to the root logger,
+# which main() routes to the log file
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+_console_handler = logging.StreamHandler(_CurrentStdout())
+_console_handler.setFormatter(logging.Formatter('%(message)s'))
+logger.addHandler(_console_handler)
+
+# Host OS name, resolved once for the whole run
+_SYSTEM = platform.system()
+
+_ncp_lock = threading.Lock()
+
+@functools.lru_cache(maxsize=1)
+def _build_ncp():
+    from nvidia_control_panel import NVIDIAControlPanel
+    return NVIDIAControlPanel()
+
+def _ncp():
+    """Return the shared NVIDIAControlPanel, constructing it on first use."""
+    # The lock keeps concurrent first calls from each building a panel
+    with _ncp_lock:
+        return _build_ncp()
 
 def simulate_platform_behavior(platform_name):
     """Simulate different platform behaviors for testing."""
-    print(f"\nTesting {platform_name} compatibility...")
-    logging.info(f"Testing {platform_name} compatibility")
+    logger.info(f"Testing {platform_name} compatibility...")
     
     try:
-        from nvidia_control_panel import NVIDIAControlPanel, CustomResolution
+        from nvidia_control_panel import CustomResolution
         
-        # Create instance - should detect actual platform automatically
-        ncp = NVIDIAControlPanel()
+        # Shared instance - detects the actual platform automatically
+        ncp = _ncp()
         
         # Test basic functionality
         settings = ncp.get_gpu_settings()
-        logging.info(f"{platform_name}: GPU settings retrieved successfully")
-        print(f"✅ {platform_name}: GPU settings retrieved")
+        logger.info(f"✅ {platform_name}: GPU settings retrieved")
         
         # Test resolution management
         resolutions = ncp.get_current_resolutions()
-        logging.info(f"{platform_name}: {len(resolutions)} resolutions available")
-        print(f"✅ {platform_name}: {len(resolutions)} resolutions available")
+        logger.info(f"✅ {platform_name}: {len(resolutions)} resolutions available")
         
         # Test custom resolution operations
         custom_res = CustomResolution(1920, 1080, 75, name=f"{platform_name}_Test")
         
         add_result = ncp.add_custom_resolution(custom_res)
-        logging.info(f"{platform_name}: Custom resolution added: {add_result}")
+        logger.info(f"{platform_name}: Custom resolution added: {add_result}")
         
         apply_result = ncp.apply_custom_resolution(custom_res)
-        logging.info(f"{platform_name}: Custom resolution applied: {apply_result}")
+        logger.info(f"{platform_name}: Custom resolution applied: {apply_result}")
         
         remove_result = ncp.remove_custom_resolution(custom_res.name)
-        logging.info(f"{platform_name}: Custom resolution removed: {remove_result}")
+        logger.info(f"{platform_name}: Custom resolution removed: {remove_result}")
         
-        print(f"✅ {platform_name}: Custom resolution operations successful")
+        logger.info(f"✅ {platform_name}: Custom resolution operations successful")
         return True
         
     except Exception as e:
-        logging.error(f"{platform_name} compatibility test failed: {e}")
-        print(f"❌ {platform_name} compatibility test failed: {e}")
+        logger.error(f"❌ {platform_name} compatibility test failed: {e}")
         return False
 
 def test_windows_compatibility():
     """Test Windows-specific functionality."""
-    print("\n=== Windows Compatibility Test ===")
-    logging.info("=== Windows Compatibility Test ===")
+    logger.info("=== Windows Compatibility Test ===")
     
     try:
-        from nvidia_control_panel import NVIDIAControlPanel
-        
-        ncp = NVIDIAControlPanel()
+        ncp = _ncp()
         
         # Test registry-based operations (Windows specific)
         settings = ncp.get_gpu_settings()
@@ -77,73 +101,60 @@ def test_windows_compatibility():
         gaming_result = ncp.optimize_for_gaming()
         power_result = ncp.optimize_for_power_saving()
         
-        logging.info("Windows: All optimization profiles executed")
-        print("✅ Windows: Optimization profiles tested")
+        logger.info("✅ Windows: Optimization profiles tested")
         
         return True
         
     except Exception as e:
-        logging.error(f"Windows compatibility test failed: {e}")
-        print(f"❌ Windows compatibility test failed: {e}")
+        logger.error(f"❌ Windows compatibility test failed: {e}")
         return False
 
 def test_linux_compatibility():
     """Test Linux fallback behavior."""
-    print("\n=== Linux Compatibility Test ===")
-    logging.info("=== Linux Compatibility Test ===")
+    logger.info("=== Linux Compatibility Test ===")
     
     try:
-        from nvidia_control_panel import NVIDIAControlPanel
-        
-        ncp = NVIDIAControlPanel()
+        ncp = _ncp()
         
         # Test that system works without Windows-specific features
         settings = ncp.get_gpu_settings()
         
         # The system should gracefully handle Linux environment
-        logging.info("Linux: System works in fallback mode")
-        print("✅ Linux: Fallback mode operational")
+        logger.info("✅ Linux: Fallback mode operational")
         
         return True
         
     except Exception as e:
-        logging.error(f"Linux compatibility test failed: {e}")
-        print(f"❌ Linux compatibility test failed: {e}")
+        logger.error(f"❌ Linux compatibility test failed: {e}")
         return False
 
 def test_macos_compatibility():
     """Test macOS compatibility."""
-    print("\n=== macOS Compatibility Test ===")
-    logging.info("=== macOS Compatibility Test ===")
+    logger.info("=== macOS Compatibility Test ===")
     
     try:
-        from nvidia_control_panel import NVIDIAControlPanel
-        
-        ncp = NVIDIAControlPanel()
+        ncp = _ncp()
         
         # Test basic functionality on macOS
         settings = ncp.get_gpu_settings()
         
         # macOS should use system command fallbacks
-        logging.info("macOS: Basic functionality available")
-        print("✅ macOS: Basic functionality operational")
+        logger.info("✅ macOS: Basic functionality operational")
         
         return True
         
     except Exception as e:
-        logging.error(f"macOS compatibility test failed: {e}")
-        print(f"❌ macOS compatibility test failed: {e}")
+        logger.error(f"❌ macOS compatibility test failed: {e}")
         return False
 
 def test_containerized_environment():
     """Test behavior in containerized environments."""
-    print("\n=== Containerized Environment Test ===")
-    logging.info("=== Containerized Environment Test ===")
+    logger.info("=== Containerized Environment Test ===")
     
     try:
-        from nvidia_control_panel import NVIDIAControlPanel
+        from nvidia_control_panel import CustomResolution
         
-        ncp = NVIDIAControlPanel()
+        ncp = _ncp()
         
         # Test that system works in constrained environments
         settings = ncp.get_gpu_settings()
@@ -155,34 +166,68 @@ def test_containerized_environment():
             ncp.add_custom_resolution(custom_res)
             ncp.remove_custom_resolution("Container_Test")
         except Exception as e:
-            logging.warning(f"Container test: Some features may not work: {e}")
+            logger.warning(f"Container test: Some features may not work: {e}")
         
-        logging.info("Container: System works in constrained environment")
-        print("✅ Container: Basic functionality operational")
+        logger.info("✅ Container: Basic functionality operational")
         
         return True
         
     except Exception as e:
-        logging.error(f"Container compatibility test failed: {e}")
-        print(f"❌ Container compatibility test failed: {e}")
+        logger.error(f"❌ Container compatibility test failed: {e}")
         return False
 
+def _run_in_sequence(stdout_proxy, tests):
+    """Run tests one after another on this thread; returns {name: (passed, output)}."""
+    return {name: run_captured(stdout_proxy, func) for name, func in tests}
+
 def main():
     """Run all cross-platform compatibility tests."""
-    print("Starting cross-platform compatibility testing...")
-    logging.info("Starting cross-platform compatibility testing")
+    file_handler = logging.FileHandler('cross_platform_compatibility_test.log', mode='w', encoding='utf-8')
+    file_handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
+    # Worker threads log through a queue; it is drained, including the
+    # summary, before main() returns
+    with queued_logging(file_handler):
+        return _run_compatibility_tests()
+
+def _run_compatibility_tests():
+    """Run the platform tests concurrently and print the summary."""
+    logger.info("Starting cross-platform compatibility testing...")
     
-    results = {}
+    # Test current platform, then specific platform functionalities
+    current_platform = _SYSTEM
+    tests = {
+        current_platform: lambda: simulate_platform_behavior(current_platform),
+        "Windows_Specific": test_windows_compatibility,
+        "Linux_Fallback": test_linux_compatibility,
+        "macOS_Basic": test_macos_compatibility,
+        "Containerized": test_containerized_environment,
+    }
+    # These change settings on the shared panel (custom resolutions,
+    # optimization profiles), so they run one after another on one worker;
+    # the read-only tests run alongside them
+    setting_tests = [(name, tests[name]) for name in (current_platform, "Windows_Specific", "Containerized")]
+    read_only_tests = [(name, func) for name, func in tests.items()
+                       if name not in dict(setting_tests)]
     
-    # Test current platform
-    current_platform = platform.system()
-    results[current_platform] = simulate_platform_behavior(current_platform)
+    # Each test's output is printed as one block when its group finishes
+    real_stdout = sys.stdout
+    stdout_proxy = PerThreadStdout(real_stdout)
+    sys.stdout = stdout_proxy
+    try:
+        with ThreadPoolExecutor(max_workers=1 + len(read_only_tests)) as executor:
+            futures = [executor.submit(_run_in_sequence, stdout_proxy, setting_tests)]
+            futures.extend(executor.submit(_run_in_sequence, stdout_proxy, [test])
+                           for test in read_only_tests)
+            completed = {}
+            for future in as_completed(futures):
+                for name, (passed, output) in future.result().items():
+                    completed[name] = passed
+                    real_stdout.write(output)
+    finally:
+        sys.stdout = real_stdout
     
-    # Test specific platform functionalities
-    results["Windows_Specific"] = test_windows_compatibility()
-    results["Linux_Fallback"] = test_linux_compatibility() 
-    results["macOS_Basic"] = test_macos_compatibility()
-    results["Containerized"] = test_containerized_environment()
+    # Report in declaration order regardless of completion order
+    results = {name: completed[name] for name in tests}
     
     # Summary
     print("\n" + "="*50)
@@ -199,12 +244,10 @@ def main():
     print("="*50)
     
     if all_passed:
-        print("🎉 All cross-platform compatibility tests PASSED!")
-        logging.info("All cross-platform compatibility tests passed")
+        logger.info("🎉 All cross-platform compatibility tests PASSED!")
         return True
     else:
-        print("❌ Some cross-platform compatibility tests FAILED!")
-        logging.warning("Some cross-platform compatibility tests failed")
+        logger.warning("❌ Some cross-platform compatibility tests FAILED!")
         return False
 
 if __name__ == "__main__":
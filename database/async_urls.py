@@ -0,0 +1,77 @@
+"""
+Async driver URLs for the Oscar Broome Revenue System database managers
+Translates the sync connection strings built by DatabaseManager into the
+URL and connect_args the asyncpg / aiomysql drivers expect
+"""
+
+import ssl
+from typing import Any, Dict, Tuple
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+
+# Async driver for each sync driver, and the query parameter carrying the SSL mode
+_ASYNC_DRIVERS = {
+    'mysql+pymysql': ('mysql+aiomysql', 'ssl_mode'),
+    'postgresql+psycopg2': ('postgresql+asyncpg', 'sslmode'),
+}
+
+# SSL modes that must encrypt the connection; the verify modes also check the certificate
+_ENCRYPTED_SSL_MODES = frozenset({'require', 'verify-ca', 'verify-full'})
+_OPTIONAL_SSL_MODES = frozenset({'disable', 'allow', 'prefer'})
+
+
+def _normalize_ssl_mode(value: str) -> str:
+    """Map libpq and MySQL spellings (REQUIRED, VERIFY_IDENTITY, ...) onto libpq names"""
+    mode = value.strip().lower().replace('_', '-')
+    return {
+        'required': 'require',
+        'preferred': 'prefer',
+        'disabled': 'disable',
+        'verify-identity': 'verify-full',
+    }.get(mode, mode)
+
+
+def build_async_engine_args(connection_string: str) -> Tuple[str, Dict[str, Any]]:
+    """
+    Build the async engine URL and connect_args for a sync connection string
+
+    Query parameters other than the SSL mode are kept. The SSL mode is passed
+    to asyncpg as its own ``ssl`` parameter; aiomysql cannot read it from the
+    URL, so an encrypting mode becomes an SSL context in connect_args.
+
+    Args:
+        connection_string: URL using the mysql+pymysql or postgresql+psycopg2 driver
+
+    Returns:
+        Tuple of (async URL, connect_args for create_async_engine)
+
+    Raises:
+        ValueError: If the driver or SSL mode is not supported
+    """
+    parts = urlsplit(connection_string)
+    if parts.scheme not in _ASYNC_DRIVERS:
+        raise ValueError(f"Unsupported database driver for async engine: {parts.scheme}")
+    async_scheme, ssl_param = _ASYNC_DRIVERS[parts.scheme]
+
+    query = []
+    ssl_mode = None
+    for key, value in parse_qsl(parts.query, keep_blank_values=True):
+        if key == ssl_param:
+            ssl_mode = _normalize_ssl_mode(value)
+        else:
+            query.append((key, value))
+
+    if ssl_mode is not None and ssl_mode not in _ENCRYPTED_SSL_MODES | _OPTIONAL_SSL_MODES:
+        raise ValueError(f"Unsupported SSL mode for async engine: {ssl_mode}")
+
+    connect_args: Dict[str, Any] = {}
+    if async_scheme == 'postgresql+asyncpg':
+        if ssl_mode is not None:
+            query.append(('ssl', ssl_mode))
+    elif ssl_mode in _ENCRYPTED_SSL_MODES:
+        context = ssl.create_default_context()
+        if ssl_mode == 'verify-ca':
+            context.check_hostname = False
+        connect_args['ssl'] = context
+
+    url = urlunsplit(parts._replace(scheme=async_scheme, query=urlencode(query)))
+    return url, connect_args
@@ -7,10 +7,12 @@ import os
 import logging
 from typing import Optional, Any
 from sqlalchemy import create_engine, MetaData, text
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
 from sqlalchemy.orm import sessionmaker, Session
 from sqlalchemy.pool import QueuePool
 from sqlalchemy.exc import SQLAlchemyError
-from contextlib import contextmanager
+from contextlib import contextmanager, asynccontextmanager
+from .async_urls import build_async_engine_args
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -21,6 +23,8 @@ class DatabaseManager:
     def __init__(self):
         self.engine = None
         self.SessionLocal = None
+        self.async_engine = None
+        self.AsyncSessionLocal = None
         self.metadata = MetaData()
         self._connection_string = self._build_connection_string()
 
@@ -59,10 +63,12 @@ class DatabaseManager:
             self.engine = create_engine(
                 self._connection_string,
                 poolclass=QueuePool,
-                pool_size=10,
-                max_overflow=20,
+                pool_size=int(os.getenv('DB_POOL_SIZE', '10')),
+                max_overflow=int(os.getenv('DB_MAX_OVERFLOW', '20')),
                 pool_timeout=30,
                 pool_recycle=3600,  # Recycle connections after 1 hour
+                pool_pre_ping=True,  # Test connections on checkout so stale ones are replaced
+                pool_use_lifo=True,  # Reuse the most recent connection so idle ones can time out
                 echo=False  # Set to True for SQL query logging in development
             )
 
@@ -166,12 +172,89 @@ class DatabaseManager:
                 "database_info": None
             }
 
+    async def init_async_db(self) -> None:
+        """Initialize the async engine for non-blocking callers"""
+        try:
+            async_url, connect_args = build_async_engine_args(self._connection_string)
+            self.async_engine = create_async_engine(
+                async_url,
+                pool_size=int(os.getenv('DB_POOL_SIZE', '10')),
+                max_overflow=int(os.getenv('DB_MAX_OVERFLOW', '20')),
+                pool_timeout=30,
+                pool_recycle=3600,
+                pool_pre_ping=True,
+                pool_use_lifo=True,
+                connect_args=connect_args,
+                echo=False
+            )
+
+            self.AsyncSessionLocal = async_sessionmaker(
+                self.async_engine,
+                class_=AsyncSession,
+                autoflush=False,
+                expire_on_commit=False
+            )
+
+            # Test connection
+            async with self.async_engine.connect() as conn:
+                await conn.execute(text("SELECT 1"))
+                logger.info("Async database connection established successfully")
+
+        except SQLAlchemyError as e:
+            logger.error(f"Failed to initialize async database: {e}")
+            raise
+
+    async def create_tables_async(self) -> None:
+        """Create all database tables through the async engine"""
+        try:
+            if self.async_engine is None:
+                raise RuntimeError("Async database not initialized. Call init_async_db() first.")
+
+            from .models import Base
+            async with self.async_engine.begin() as conn:
+                await conn.run_sync(Base.metadata.create_all)
+            logger.info("Database tables created successfully")
+
+        except SQLAlchemyError as e:
+            logger.error(f"Failed to create tables: {e}")
+            raise
+
+    @asynccontextmanager
+    async def get_async_db(self):
+        """Get async database session with automatic cleanup"""
+        if self.AsyncSessionLocal is None:
+            raise RuntimeError("Async database not initialized. Call init_async_db() first.")
+
+        async with self.AsyncSessionLocal() as db:
+            try:
+                yield db
+            except Exception as e:
+                await db.rollback()
+                logger.error(f"Database session error: {e}")
+                raise
+
+    async def async_health_check(self) -> dict:
+        """Check database connectivity without blocking the event loop"""
+        try:
+            async with self.async_engine.connect() as conn:
+                await conn.execute(text("SELECT 1"))
+            return {"status": "healthy", "message": "Database connection is working"}
+        except Exception as e:
+            logger.error(f"Async database health check failed: {e}")
+            return {"status": "unhealthy", "message": f"Database connection failed: {str(e)}"}
+
     def close(self) -> None:
         """Close database connections"""
         if self.engine:
             self.engine.dispose()
             logger.info("Database connections closed")
 
+    async def close_async(self) -> None:
+        """Close async database connections"""
+        if self.async_engine:
+            await self.async_engine.dispose()
+            logger.info("Async database connections closed")
+
 # Global database manager instance
 db_manager = DatabaseManager()
 
@@ -187,6 +270,14 @@ def create_tables():
     """Create database tables"""
     db_manager.create_tables()
 
+def get_async_db():
+    """Async session context manager for non-blocking request handlers"""
+    return db_manager.get_async_db()
+
+async def init_async_db():
+    """Initialize async database connection"""
+    await db_manager.init_async_db()
+
 def get_db_manager():
     """Get database manager instance"""
     return db_manager
@@ -9,6 +9,7 @@ from sqlalchemy.orm import sessionmaker, Session
 from sqlalchemy.pool import QueuePool
 from sqlalchemy.exc import SQLAlchemyError
 from contextlib import contextmanager
+from contextvars import ContextVar
 from typing import Generator, Optional
 from urllib.parse import urlparse
 
@@ -52,10 +53,16 @@ except Exception as e:
 # Create session factory
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Liveness probe compiled once and reused by every connection test
+_PROBE = text("SELECT 1")
+
+# Session bound to the current request; ContextVar keeps it per thread/task
+_db_session: ContextVar[Optional[Session]] = ContextVar("db_session", default=None)
+
 def get_db() -> Generator[Session, None, None]:
     """
     Dependency function to get database session
-    Use in FastAPI route dependencies or Flask request context
+    Use in FastAPI route dependencies; Flask apps should use db() with init_app()
     """
     db = SessionLocal()
     try:
@@ -63,6 +70,41 @@ def get_db() -> Generator[Session, None, None]:
     finally:
         db.close()
 
+def db() -> Session:
+    """
+    Get the session for the current request context
+    Opened on first use and closed by close_request_session()
+    """
+    session = _db_session.get()
+    if session is None:
+        session = SessionLocal()
+        _db_session.set(session)
+    return session
+
+def close_request_session(exc: Optional[BaseException] = None) -> None:
+    """
+    Close the current request's session, rolling back if the request failed
+    Registered as a Flask teardown_appcontext handler by init_app()
+    """
+    session = _db_session.get()
+    if session is None:
+        return
+    try:
+        if exc is not None:
+            session.rollback()
+    finally:
+        session.close()
+        _db_session.set(None)
+
+def init_app(app) -> None:
+    """
+    Wire request-scoped sessions into a Flask app
+    Usage:
+        init_app(app)
+        # inside a view: db().query(...)
+    """
+    app.teardown_appcontext(close_request_session)
+
 @contextmanager
 def get_db_context():
     """
@@ -110,7 +152,7 @@ def test_connection() -> bool:
     """
     try:
         with engine.connect() as conn:
-            conn.execute(text("SELECT 1"))
+            conn.execute(_PROBE)
             logger.info("✅ Database connection test successful")
         return True
     except SQLAlchemyError as e:
@@ -120,13 +162,16 @@ def test_connection() -> bool:
         logger.error(f"❌ Unexpected error during connection test: {e}")
         return False
 
-def get_connection_info() -> dict:
+def get_connection_info(connected: Optional[bool] = None) -> dict:
     """
     Get database connection information
-    Returns dict with connection details
+    Returns dict with connection details; pass connected to reuse the result
+    of a probe the caller already ran instead of probing again
     """
     try:
         parsed_url = urlparse(DATABASE_URL)
+        if connected is None:
+            connected = test_connection()
         return {
             'database_url': f"{parsed_url.scheme}://{parsed_url.hostname}:{parsed_url.port}/{parsed_url.path}",
             'pool_size': engine.pool.size(),
@@ -134,7 +179,7 @@ def get_connection_info() -> dict:
             'checked_out': engine.pool.checkedout(),
             'invalid': engine.pool.invalid(),
             'available': engine.pool.size() - engine.pool.checkedout(),
-            'engine_status': 'connected' if test_connection() else 'disconnected'
+            'engine_status': 'connected' if connected else 'disconnected'
         }
     except Exception as e:
         logger.error(f"❌ Failed to get connection info: {e}")
@@ -146,14 +191,15 @@ def health_check() -> dict:
     Returns dict with health status and metrics
     """
     try:
-        start_time = time.time()
+        # One probe per check; the pool stats reuse its result
+        start_time = time.perf_counter()
         connection_ok = test_connection()
-        response_time = time.time() - start_time
+        response_time = time.perf_counter() - start_time
 
         return {
             'status': 'healthy' if connection_ok else 'unhealthy',
             'response_time_ms': round(response_time * 1000, 2),
-            'connection_pool': get_connection_info(),
+            'connection_pool': get_connection_info(connection_ok),
             'timestamp': datetime.utcnow().isoformat()
         }
     except Exception as e:
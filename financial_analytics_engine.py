@@ -7,8 +7,9 @@ and comprehensive reporting capabilities for achieving financial excellence.
 
 from datetime import datetime, timedelta
 from typing import List, Optional, Dict, Any, Tuple
-from sqlalchemy import create_engine, Column, Integer, String, Float, DateTime, func, and_, or_
+from sqlalchemy import create_engine, event, Column, Integer, String, Float, DateTime, func, and_, or_
 from sqlalchemy.orm import declarative_base, sessionmaker
+from sqlalchemy.pool import StaticPool
 from sqlalchemy.sql import func as sql_func
 import json
 import statistics
@@ -21,6 +22,8 @@ from sklearn.ensemble import RandomForestRegressor
 from sklearn.preprocessing import StandardScaler
 import joblib
 import os
+import copy
+import time
 
 Base = declarative_base()
 
@@ -269,13 +272,54 @@ class AIPredictiveAnalytics:
 
         return list(set(recommendations))  # Remove duplicates
 
+IN_MEMORY_SQLITE_URLS = ("sqlite://", "sqlite:///:memory:")
+
+def _create_tracker_engine(db_url: str, relaxed_durability: bool = False):
+    """Create the tracker engine, tuned for SQLite where applicable.
+
+    In-memory SQLite shares one connection via StaticPool so every session
+    sees the same database. With relaxed_durability, on-disk SQLite runs in
+    WAL mode with synchronous=NORMAL, which removes a sync per commit but can
+    lose the last commits on power loss; only test runs should opt in.
+    """
+    if db_url in IN_MEMORY_SQLITE_URLS:
+        return create_engine(db_url, echo=False, poolclass=StaticPool,
+                             connect_args={'check_same_thread': False})
+
+    engine = create_engine(db_url, echo=False)
+    if relaxed_durability and engine.dialect.name == "sqlite":
+        @event.listens_for(engine, "connect")
+        def _set_sqlite_pragmas(dbapi_connection, connection_record):
+            cursor = dbapi_connection.cursor()
+            cursor.execute("PRAGMA journal_mode=WAL")
+            cursor.execute("PRAGMA synchronous=NORMAL")
+            cursor.close()
+    return engine
+
+# Derived results older than this are recomputed even without a local write, so
+# the utcnow()-relative windows keep moving and other writers' rows show up
+DERIVED_CACHE_TTL_SECONDS = 60
+
 class AdvancedRevenueTracker:
-    def __init__(self, db_url: str = "sqlite:///revenue.db"):
-        self.engine = create_engine(db_url, echo=False)
+    def __init__(self, db_url: str = "sqlite:///revenue.db", relaxed_durability: bool = False):
+        self.engine = _create_tracker_engine(db_url, relaxed_durability)
         Base.metadata.create_all(self.engine)
         self.Session = sessionmaker(bind=self.engine)
         self.kpis = FinancialKPIs()
         self.ai_analytics = AIPredictiveAnalytics()
+        # Bumped on every write; derived results are cached against it as
+        # (key, stored_at, value) and expire after DERIVED_CACHE_TTL_SECONDS
+        self._version = 0
+        self._kpi_cache = (None, 0.0, None)
+        self._dashboard_cache = (None, 0.0, None)
+
+    @staticmethod
+    def _cached_copy(cache, key):
+        """Return a private copy of a fresh cached value for key, or None"""
+        cached_key, stored_at, value = cache
+        if cached_key == key and time.monotonic() - stored_at < DERIVED_CACHE_TTL_SECONDS:
+            return copy.deepcopy(value)
+        return None
 
     def add_record(self, description: str, amount: float, category: RevenueCategory = RevenueCategory.OTHER,
                    date: Optional[datetime] = None, source: str = "Unknown", tags: List[str] = None) -> RevenueRecord:
@@ -297,8 +341,37 @@ class AdvancedRevenueTracker:
         session.commit()
         session.refresh(record)
         session.close()
+        self._version += 1
         return record
 
+    def add_records_bulk(self, rows: List[Tuple[str, float, RevenueCategory, Optional[datetime]]],
+                         source: str = "Unknown") -> int:
+        """Insert many (description, amount, category, date) rows in one transaction."""
+        now = datetime.utcnow()
+        mappings = []
+        for description, amount, category, date in rows:
+            if amount < 0:
+                raise ValueError("Amount must be non-negative")
+            if not description:
+                raise ValueError("Description must not be empty")
+            mappings.append({
+                'description': description,
+                'amount': amount,
+                'category': category.value,
+                'date': date or now,
+                'source': source,
+                'tags': "[]"
+            })
+
+        session = self.Session()
+        try:
+            session.bulk_insert_mappings(RevenueRecord, mappings)
+            session.commit()
+        finally:
+            session.close()
+        self._version += 1
+        return len(mappings)
+
     def get_all_records(self, category: Optional[RevenueCategory] = None,
                        start_date: Optional[datetime] = None, end_date: Optional[datetime] = None) -> List[RevenueRecord]:
         session = self.Session()
@@ -381,6 +454,11 @@ class AdvancedRevenueTracker:
 
     def calculate_comprehensive_kpis(self, current_period_days: int = 30, previous_period_days: int = 30) -> Dict[str, Any]:
         """Calculate comprehensive financial KPIs with advanced metrics"""
+        cache_key = (self._version, current_period_days, previous_period_days)
+        cached = self._cached_copy(self._kpi_cache, cache_key)
+        if cached is not None:
+            return cached
+
         now = datetime.utcnow()
         current_start = now - timedelta(days=current_period_days)
         previous_start = current_start - timedelta(days=previous_period_days)
@@ -412,7 +490,7 @@ class AdvancedRevenueTracker:
                 # If category doesn't match enum, calculate without category filter
                 category_growth[category] = 0.0
 
-        return {
+        kpis = {
             'current_period_revenue': current_revenue,
             'previous_period_revenue': previous_revenue,
             'growth_rate': growth_rate,
@@ -424,6 +502,8 @@ class AdvancedRevenueTracker:
             'period_days': current_period_days,
             'revenue_per_transaction': current_revenue / len(current_records) if current_records else 0
         }
+        self._kpi_cache = (cache_key, time.monotonic(), copy.deepcopy(kpis))
+        return kpis
 
     def advanced_forecasting(self, months_ahead: int = 6, method: str = 'linear') -> Dict[str, Any]:
         """Advanced revenue forecasting with multiple methods"""
@@ -519,6 +599,11 @@ class AdvancedRevenueTracker:
 
     def generate_executive_dashboard(self, period_days: int = 30) -> Dict[str, Any]:
         """Generate comprehensive executive dashboard data"""
+        cache_key = (self._version, period_days)
+        cached = self._cached_copy(self._dashboard_cache, cache_key)
+        if cached is not None:
+            return cached
+
         now = datetime.utcnow()
         start_date = now - timedelta(days=period_days)
 
@@ -554,7 +639,7 @@ class AdvancedRevenueTracker:
         ai_forecast = self.ai_powered_forecasting(days_ahead=30)
         ai_risk = self.ai_risk_analysis()
 
-        return {
+        dashboard = {
             'period': {
                 'start_date': start_date.isoformat(),
                 'end_date': now.isoformat(),
@@ -584,6 +669,8 @@ class AdvancedRevenueTracker:
                 'recommendations': self._generate_ai_recommendations(ai_forecast, ai_risk)
             }
         }
+        self._dashboard_cache = (cache_key, time.monotonic(), copy.deepcopy(dashboard))
+        return dashboard
 
     def _generate_ai_recommendations(self, forecast: Dict, risk: Dict) -> List[str]:
         """Generate AI-powered recommendations"""
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Shared plumbing for the standalone test scripts: per-thread stdout capture
+for tests run on a thread pool, and queued file logging whose listener is
+started and stopped around a run.
+"""
+
+import io
+import logging
+import queue
+import threading
+from contextlib import contextmanager
+from logging.handlers import QueueHandler, QueueListener
+
+
+class PerThreadStdout:
+    """stdout proxy that routes prints from worker threads into per-test buffers."""
+
+    def __init__(self, stream):
+        self._stream = stream
+        self._local = threading.local()
+
+    def capture(self, buffer):
+        """Route this thread's writes into buffer, or back to the real stream when None."""
+        if buffer is not None:
+            self._local.buffer = buffer
+        elif hasattr(self._local, "buffer"):
+            del self._local.buffer
+
+    def write(self, text):
+        return getattr(self._local, "buffer", self._stream).write(text)
+
+    def flush(self):
+        getattr(self._local, "buffer", self._stream).flush()
+
+
+def run_captured(stdout_proxy, func):
+    """Run func with this thread's output captured; returns (result, output)."""
+    buffer = io.StringIO()
+    stdout_proxy.capture(buffer)
+    try:
+        return func(), buffer.getvalue()
+    finally:
+        stdout_proxy.capture(None)
+
+
+@contextmanager
+def queued_logging(*handlers, level=logging.INFO):
+    """
+    Send root log records through a queue to handlers for the duration of the block.
+
+    A single listener thread does the handler I/O, so logging from worker
+    threads never blocks or interleaves. On exit the listener drains the
+    queue, the root QueueHandler is removed and the handlers are closed, so
+    records logged afterwards are not queued into a dead listener.
+    """
+    log_queue = queue.Queue(-1)
+    queue_handler = QueueHandler(log_queue)
+    listener = QueueListener(log_queue, *handlers)
+    root_logger = logging.getLogger()
+    previous_level = root_logger.level
+    root_logger.addHandler(queue_handler)
+    root_logger.setLevel(level)
+    listener.start()
+    try:
+        yield
+    finally:
+        listener.stop()
+        root_logger.removeHandler(queue_handler)
+        root_logger.setLevel(previous_level)
+        for handler in handlers:
+            handler.close()
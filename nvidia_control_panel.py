@@ -24,6 +24,9 @@ from dataclasses import dataclass
 logging.basicConfig(level=logging.DEBUG)
 logger = logging.getLogger(__name__)
 
+# Host OS name, resolved once; it cannot change for the life of the process
+_SYSTEM = platform.system()
+
 # ===== Enums and Dataclasses =====
 
 class PowerMode(Enum):
@@ -277,7 +280,7 @@ class NVIDIAControlPanel:
         self.nvapi_available = self._check_nvapi_availability()
         self.gpu_count = self._get_gpu_count()
         self.driver_version = self._get_driver_version()
-        self.is_windows = platform.system() == "Windows"
+        self.is_windows = _SYSTEM == "Windows"
         self.nvapi_handle = None
         
         if self.nvapi_available and self.is_windows:
@@ -288,7 +291,7 @@ class NVIDIAControlPanel:
     def _check_nvapi_availability(self) -> bool:
         """Check if NVAPI is available on the system."""
         try:
-            if platform.system() != "Windows":
+            if _SYSTEM != "Windows":
                 return False
                 
             # Try to load NVAPI DLL
@@ -618,7 +621,7 @@ class NVIDIAControlPanel:
         settings["gpu_count"] = self.gpu_count
         settings["driver_version"] = self.driver_version
         settings["nvapi_available"] = self.nvapi_available
-        settings["platform"] = platform.system()
+        settings["platform"] = _SYSTEM
         
         logger.info(f"Retrieved GPU settings: {settings}")
         return settings
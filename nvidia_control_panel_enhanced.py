@@ -29,7 +29,7 @@ from typing import Dict, Any, List, Optional, Union, Set, Callable
 from enum import Enum, auto
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
-from functools import lru_cache, wraps
+from functools import cached_property, lru_cache, wraps
 from contextlib import contextmanager
 
 # Third-party imports with fallback handling
@@ -99,18 +99,24 @@ class PowerMode(Enum):
     PREFER_MAX_PERFORMANCE = "Prefer Maximum Performance"
     PREFER_CONSISTENT_PERFORMANCE = "Prefer Consistent Performance"
 
+PowerMode._VALUE_SET = frozenset(mode.value for mode in PowerMode)
+
 class TextureFiltering(Enum):
     HIGH_QUALITY = "High Quality"
     QUALITY = "Quality"
     PERFORMANCE = "Performance"
     HIGH_PERFORMANCE = "High Performance"
 
+TextureFiltering._VALUE_SET = frozenset(mode.value for mode in TextureFiltering)
+
 class FrameSyncMode(Enum):
     OFF = "Off"
     ON = "On"
     MASTER = "Master"
     SLAVE = "Slave"
 
+FrameSyncMode._VALUE_SET = frozenset(mode.value for mode in FrameSyncMode)
+
 class SDIOutputFormat(Enum):
     SDI_8BIT = "8-bit"
     SDI_10BIT = "10-bit"
@@ -128,6 +134,8 @@ class VerticalSync(Enum):
     ADAPTIVE = "Adaptive"
     FAST = "Fast"
 
+VerticalSync._VALUE_SET = frozenset(mode.value for mode in VerticalSync)
+
 class AntiAliasingMode(Enum):
     APPLICATION_CONTROLLED = "Application-controlled"
     OFF = "Off"
@@ -137,6 +145,8 @@ class AntiAliasingMode(Enum):
     MSAA_8X = "8x MSAA"
     MSAA_16X = "16x MSAA"
 
+AntiAliasingMode._VALUE_SET = frozenset(mode.value for mode in AntiAliasingMode)
+
 class AnisotropicFiltering(Enum):
     APPLICATION_CONTROLLED = "Application-controlled"
     OFF = "Off"
@@ -145,6 +155,8 @@ class AnisotropicFiltering(Enum):
     X8 = "8x"
     X16 = "16x"
 
+AnisotropicFiltering._VALUE_SET = frozenset(mode.value for mode in AnisotropicFiltering)
+
 class ColorFormat(Enum):
     RGB = "RGB"
     YCbCr444 = "YCbCr444"
@@ -453,7 +465,14 @@ class VideoSettings:
         if not -10 <= self.overscan_percentage <= 10:
             raise ValueError(f"Overscan percentage {self.overscan_percentage} is outside valid range (-10-10)")
 
-@dataclass
+# dataclass(slots=True) needs Python 3.10; CI still covers 3.9
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+_COLOR_DEPTHS = frozenset((8, 16, 24, 32))
+_SCALING_MODES = frozenset(("No scaling", "Aspect ratio", "Full-screen", "Center"))
+_TIMING_STANDARDS = frozenset(("Automatic", "CVT", "CVT-RB", "GTF", "Manual"))
+
+@dataclass(**_DATACLASS_SLOTS)
 class CustomResolution:
     """Represents a custom display resolution configuration."""
     width: int
@@ -469,19 +488,27 @@ class CustomResolution:
         if not self.name:
             self.name = f"{self.width}x{self.height}@{self.refresh_rate}Hz"
         
-        # Basic validation
+        # Single fast-path check; the specific error is only worked out on failure
+        if not (640 <= self.width <= 7680 and 480 <= self.height <= 4320
+                and 24 <= self.refresh_rate <= 240
+                and self.color_depth in _COLOR_DEPTHS
+                and self.scaling in _SCALING_MODES
+                and self.timing_standard in _TIMING_STANDARDS):
+            raise ValueError(self._diagnose())
+
+    def _diagnose(self) -> str:
+        """Describe the first invalid parameter."""
         if self.width < 640 or self.width > 7680:
-            raise ValueError(f"Width {self.width} is outside valid range (640-7680)")
+            return f"Width {self.width} is outside valid range (640-7680)"
         if self.height < 480 or self.height > 4320:
-            raise ValueError(f"Height {self.height} is outside valid range (480-4320)")
+            return f"Height {self.height} is outside valid range (480-4320)"
         if self.refresh_rate < 24 or self.refresh_rate > 240:
-            raise ValueError(f"Refresh rate {self.refresh_rate} is outside valid range (24-240Hz)")
-        if self.color_depth not in [8, 16, 24, 32]:
-            raise ValueError(f"Color depth {self.color_depth} must be 8, 16, 24, or 32")
-        if self.scaling not in ["No scaling", "Aspect ratio", "Full-screen", "Center"]:
-            raise ValueError(f"Invalid scaling mode: {self.scaling}")
-        if self.timing_standard not in ["Automatic", "CVT", "CVT-RB", "GTF", "Manual"]:
-            raise ValueError(f"Invalid timing standard: {self.timing_standard}")
+            return f"Refresh rate {self.refresh_rate} is outside valid range (24-240Hz)"
+        if self.color_depth not in _COLOR_DEPTHS:
+            return f"Color depth {self.color_depth} must be 8, 16, 24, or 32"
+        if self.scaling not in _SCALING_MODES:
+            return f"Invalid scaling mode: {self.scaling}"
+        return f"Invalid timing standard: {self.timing_standard}"
 
 @dataclass
 class PhysXConfiguration:
@@ -575,6 +602,62 @@ class QuadroPlexConfig:
     mosaic_enabled: bool = False
     # Add other relevant fields as needed
 
+# ===== Settings Validation =====
+
+_POWER_MODE_BY_REGISTRY_VALUE = {
+    0: PowerMode.OPTIMAL_POWER.value,
+    1: PowerMode.ADAPTIVE.value,
+    2: PowerMode.PREFER_MAX_PERFORMANCE.value,
+    3: PowerMode.PREFER_CONSISTENT_PERFORMANCE.value,
+}
+
+# Setting name -> (allowed values, label used in error messages)
+_STRING_SETTING_CHOICES = {
+    "texture_filtering": (TextureFiltering._VALUE_SET, "texture filtering"),
+    "vertical_sync": (VerticalSync._VALUE_SET, "vertical sync"),
+    "anti_aliasing": (AntiAliasingMode._VALUE_SET, "anti-aliasing"),
+    "anisotropic_filtering": (AnisotropicFiltering._VALUE_SET, "anisotropic filtering"),
+}
+
+def _validate_settings_uncached(settings: Dict[str, Any]) -> Dict[str, Any]:
+    """Validate GPU settings, raising ValueError on the first invalid entry."""
+    validated = {}
+
+    if "power_mode" in settings:
+        power_mode = settings["power_mode"]
+        if isinstance(power_mode, str):
+            if power_mode not in PowerMode._VALUE_SET:
+                raise ValueError(f"Invalid power mode: {power_mode}")
+            validated["power_mode"] = power_mode
+        elif isinstance(power_mode, int):
+            # Handle numeric registry values
+            validated["power_mode"] = _POWER_MODE_BY_REGISTRY_VALUE.get(power_mode, PowerMode.OPTIMAL_POWER.value)
+        else:
+            raise ValueError(f"Power mode must be string or int, got {type(power_mode)}")
+
+    for name, (allowed, label) in _STRING_SETTING_CHOICES.items():
+        if name not in settings:
+            continue
+        value = settings[name]
+        if not isinstance(value, str):
+            raise ValueError(f"{label.capitalize()} must be string, got {type(value)}")
+        if value not in allowed:
+            raise ValueError(f"Invalid {label}: {value}")
+        validated[name] = value
+
+    return validated
+
+@lru_cache(maxsize=512)
+def _validate_settings_cached(key: frozenset) -> tuple:
+    """Validate a hashable settings snapshot of (name, type, value) triples.
+
+    The type is part of the key so that equal-but-different values such as
+    1 and 1.0 do not share a cache entry. Invalid settings raise and are
+    therefore never cached.
+    """
+    settings = {name: value for name, _, value in key}
+    return tuple(_validate_settings_uncached(settings).items())
+
 # ===== Main NVIDIA Control Panel Class =====
 
 class NVIDIAControlPanel:
@@ -595,7 +678,7 @@ class NVIDIAControlPanel:
             return
 
         # Set platform information first
-        self.is_windows = platform.system() == "Windows"
+        self.is_windows = self.platform_name == "Windows"
 
         self.nvapi_available = self._check_nvapi_availability()
         self.gpu_count = self._get_gpu_count()
@@ -608,20 +691,34 @@ class NVIDIAControlPanel:
         self.gpu_handles = []
         self._performance_counters = {}
         self._gpu_profiles = {}
+        self._topology_cache: Optional[SystemTopology] = None
 
         # Initialize platform-specific components
         if self.nvapi_available and self.is_windows:
             self._initialize_nvapi()
 
+        # Static properties are queried once; get_gpu_settings merges them into each result
+        self._cached_static_settings = {
+            "gpu_count": self.gpu_count,
+            "driver_version": self.driver_version,
+            "nvapi_available": self.nvapi_available,
+            "platform": self.platform_name,
+        }
+
         self._initialized = True
         logger.info(f"NVIDIA Control Panel initialized: {self.gpu_count} GPUs, NVAPI: {self.nvapi_available}")
 
+    @cached_property
+    def platform_name(self) -> str:
+        """Operating system name, resolved once per instance."""
+        return platform.system()
+
     # ===== Core Initialization Methods =====
 
     def _check_nvapi_availability(self) -> bool:
         """Check if NVAPI is available on the system."""
         try:
-            if platform.system() != "Windows":
+            if not self.is_windows:
                 return False
                 
             # Try to load NVAPI DLL
@@ -811,10 +908,7 @@ class NVIDIAControlPanel:
                 settings[key] = value
                 
         settings["gpu_index"] = gpu_index
-        settings["gpu_count"] = self.gpu_count
-        settings["driver_version"] = self.driver_version
-        settings["nvapi_available"] = self.nvapi_available
-        settings["platform"] = platform.system()
+        settings.update(self._cached_static_settings)
         
         logger.debug(f"Retrieved GPU settings: {settings}")
         return settings
@@ -834,78 +928,12 @@ class NVIDIAControlPanel:
 
     def _validate_settings(self, settings: Dict[str, Any]) -> Dict[str, Any]:
         """Validate GPU settings before applying them."""
-        validated = {}
-
-        # Validate power mode
-        if "power_mode" in settings:
-            power_mode = settings["power_mode"]
-            if isinstance(power_mode, str):
-                # Convert string to enum value if needed
-                for mode in PowerMode:
-                    if mode.value == power_mode:
-                        validated["power_mode"] = power_mode
-                        break
-                else:
-                    raise ValueError(f"Invalid power mode: {power_mode}")
-            elif isinstance(power_mode, int):
-                # Handle numeric values
-                validated["power_mode"] = self._map_power_mode(power_mode)
-            else:
-                raise ValueError(f"Power mode must be string or int, got {type(power_mode)}")
-
-        # Validate texture filtering
-        if "texture_filtering" in settings:
-            texture_filtering = settings["texture_filtering"]
-            if isinstance(texture_filtering, str):
-                for mode in TextureFiltering:
-                    if mode.value == texture_filtering:
-                        validated["texture_filtering"] = texture_filtering
-                        break
-                else:
-                    raise ValueError(f"Invalid texture filtering: {texture_filtering}")
-            else:
-                raise ValueError(f"Texture filtering must be string, got {type(texture_filtering)}")
-
-        # Validate vertical sync
-        if "vertical_sync" in settings:
-            vsync = settings["vertical_sync"]
-            if isinstance(vsync, str):
-                for mode in VerticalSync:
-                    if mode.value == vsync:
-                        validated["vertical_sync"] = vsync
-                        break
-                else:
-                    raise ValueError(f"Invalid vertical sync: {vsync}")
-            else:
-                raise ValueError(f"Vertical sync must be string, got {type(vsync)}")
-
-        # Validate anti-aliasing
-        if "anti_aliasing" in settings:
-            aa = settings["anti_aliasing"]
-            if isinstance(aa, str):
-                for mode in AntiAliasingMode:
-                    if mode.value == aa:
-                        validated["anti_aliasing"] = aa
-                        break
-                else:
-                    raise ValueError(f"Invalid anti-aliasing: {aa}")
-            else:
-                raise ValueError(f"Anti-aliasing must be string, got {type(aa)}")
-
-        # Validate anisotropic filtering
-        if "anisotropic_filtering" in settings:
-            af = settings["anisotropic_filtering"]
-            if isinstance(af, str):
-                for mode in AnisotropicFiltering:
-                    if mode.value == af:
-                        validated["anisotropic_filtering"] = af
-                        break
-                else:
-                    raise ValueError(f"Invalid anisotropic filtering: {af}")
-            else:
-                raise ValueError(f"Anisotropic filtering must be string, got {type(af)}")
-
-        return validated
+        try:
+            key = frozenset((name, type(value), value) for name, value in settings.items())
+        except TypeError:
+            # Unhashable values (e.g. lists under unknown keys) cannot form a cache key; validate uncached
+            return _validate_settings_uncached(settings)
+        return dict(_validate_settings_cached(key))
     
     def _get_default_settings(self) -> Dict[str, Any]:
         """Get default settings for fallback."""
@@ -923,13 +951,7 @@ class NVIDIAControlPanel:
     
     def _map_power_mode(self, registry_value: int) -> str:
         """Map registry power mode value to human-readable string."""
-        power_modes = {
-            0: PowerMode.OPTIMAL_POWER.value,
-            1: PowerMode.ADAPTIVE.value,
-            2: PowerMode.PREFER_MAX_PERFORMANCE.value,
-            3: PowerMode.PREFER_CONSISTENT_PERFORMANCE.value,
-        }
-        return power_modes.get(registry_value, PowerMode.OPTIMAL_POWER.value)
+        return _POWER_MODE_BY_REGISTRY_VALUE.get(registry_value, PowerMode.OPTIMAL_POWER.value)
 
     @retry_on_failure(max_retries=3)
     def set_gpu_settings(self, settings: Dict[str, Any], gpu_index: int = 0) -> str:
@@ -1089,37 +1111,50 @@ class NVIDIAControlPanel:
 
     # ===== System Topology Methods =====
 
-    @cache_results(ttl=60)  # Cache for 1 minute
-    @retry_on_failure(max_retries=2)
     def get_system_topology(self) -> SystemTopology:
-        """Get the complete system topology including GPUs and displays."""
-        try:
-            topology = SystemTopology(
-                topology_type=TopologyType.UNKNOWN,
-                gpu_nodes=[],
-                display_nodes=[],
-                connections=[]
-            )
-            
-            if self.nvapi_available:
-                topology = self._get_topology_via_nvapi()
-            elif self.is_windows:
-                topology = self._get_topology_via_wmi()
-            else:
-                topology = self._get_topology_via_system_commands()
-                
-            logger.info(f"Retrieved system topology: {topology.topology_type}")
-            return topology
+        """Get the complete system topology including GPUs and displays.
+
+        Topology is discovered once and reused; call invalidate_topology()
+        after a GPU or display hotplug event to force rediscovery. A failed
+        discovery returns a basic topology without caching it, so the next
+        lookup tries again.
+        """
+        if self._topology_cache is None:
+            try:
+                self._topology_cache = self._discover_topology()
+            except Exception as e:
+                logger.error(f"Error getting system topology: {e}")
+                # Return basic topology with available information
+                return self._get_basic_topology()
+        return self._topology_cache
+
+    def invalidate_topology(self) -> None:
+        """Drop the cached system topology so the next lookup rediscovers it."""
+        self._topology_cache = None
+
+    @retry_on_failure(max_retries=2)
+    def _discover_topology(self) -> SystemTopology:
+        """Discover the system topology from NVAPI, WMI or system commands.
+
+        Errors propagate so retry_on_failure can retry transient failures.
+        """
+        if self.nvapi_available:
+            topology = self._get_topology_via_nvapi()
+        elif self.is_windows:
+            topology = self._get_topology_via_wmi()
+        else:
+            topology = self._get_topology_via_system_commands()
             
-        except Exception as e:
-            logger.error(f"Error getting system topology: {e}")
-            # Return basic topology with available information
-            return self._get_basic_topology()
+        logger.info(f"Retrieved system topology: {topology.topology_type}")
+        return topology
 
     @retry_on_failure(max_retries=2)
     def get_gpu_topology_info(self, gpu_index: int = 0) -> GPUTopologyNode:
         """Get detailed topology information for a specific GPU."""
         try:
+            gpu_nodes = self.get_system_topology().gpu_nodes
+            if 0 <= gpu_index < len(gpu_nodes):
+                return gpu_nodes[gpu_index]
             if self.nvapi_available:
                 return self._get_gpu_topology_via_nvapi(gpu_index)
             else:
@@ -1141,6 +1176,9 @@ class NVIDIAControlPanel:
     def get_display_topology_info(self, display_index: int = 0) -> DisplayTopologyNode:
         """Get detailed topology information for a specific display."""
         try:
+            display_nodes = self.get_system_topology().display_nodes
+            if 0 <= display_index < len(display_nodes):
+                return display_nodes[display_index]
             if self.nvapi_available:
                 return self._get_display_topology_via_nvapi(display_index)
             else:
@@ -1248,11 +1286,9 @@ class NVIDIAControlPanel:
             )
             
         except ImportError:
+            # Permanent: the basic topology is as good as this host gets
             logger.warning("WMI not available for topology detection")
             return self._get_basic_topology()
-        except Exception as e:
-            logger.error(f"WMI topology detection failed: {e}")
-            return self._get_basic_topology()
 
     def _get_topology_via_system_commands(self) -> SystemTopology:
         """Get system topology using system commands (Linux/macOS)."""
@@ -1289,8 +1325,9 @@ class NVIDIAControlPanel:
                 connections=[]
             )
             
-        except Exception as e:
-            logger.error(f"System command topology detection failed: {e}")
+        except FileNotFoundError:
+            # Permanent: no nvidia-smi on this host
+            logger.warning("nvidia-smi not available for topology detection")
             return self._get_basic_topology()
 
     def _get_gpu_topology_via_nvapi(self, gpu_index: int) -> GPUTopologyNode:
@@ -9,6 +9,7 @@ database migrations, model training, and initial report generation.
 
 import os
 import sys
+import argparse
 from financial_analytics_engine import AdvancedRevenueTracker, RevenueCategory
 from datetime import datetime, timedelta
 
@@ -42,7 +43,14 @@ def generate_initial_reports():
     result = tracker.export_comprehensive_report(report_filename)
     print(f"✅ {result}")
 
-def main():
+def build_parser():
+    return argparse.ArgumentParser(
+        description="OSCAR-BROOME-REVENUE production deployment: runs database migrations, "
+                    "trains AI models and generates the initial financial report."
+    )
+
+def main(argv=None):
+    build_parser().parse_args(argv)
     print("🚀 Starting production deployment script for Financial Analytics Engine")
     run_database_migrations()
     train_ai_models()
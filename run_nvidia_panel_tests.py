@@ -0,0 +1,24 @@
+#!/usr/bin/env python3
+"""
+Script to run the NVIDIA Control Panel test scripts in a single process
+so interpreter start-up and shared imports are paid once per run.
+"""
+
+import sys
+import os
+
+# Add current directory to path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+def main():
+    """Run the comprehensive panel suite, then the resolution management test."""
+    from comprehensive_nvidia_test import main as run_panel_tests
+    panel_status = run_panel_tests()
+
+    from comprehensive_resolution_test import main as run_resolution_test
+    resolution_ok = run_resolution_test()
+
+    return 0 if panel_status == 0 and resolution_ok else 1
+
+if __name__ == "__main__":
+    sys.exit(main())
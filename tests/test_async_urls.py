@@ -0,0 +1,70 @@
+"""
+Test suite for async engine URL translation
+Tests build_async_engine_args for the asyncpg and aiomysql drivers
+"""
+
+import ssl
+import pytest
+from urllib.parse import urlsplit, parse_qsl
+from database.async_urls import build_async_engine_args
+
+
+def _query(url):
+    return dict(parse_qsl(urlsplit(url).query))
+
+
+class TestBuildAsyncEngineArgs:
+    """Test cases for build_async_engine_args"""
+
+    def test_postgresql_driver_swapped(self):
+        """Test psycopg2 URLs become asyncpg URLs"""
+        url, connect_args = build_async_engine_args("postgresql+psycopg2://u:p@db:5432/revenue")
+        assert url == "postgresql+asyncpg://u:p@db:5432/revenue"
+        assert connect_args == {}
+
+    def test_postgresql_sslmode_renamed(self):
+        """Test sslmode is passed to asyncpg as ssl"""
+        url, connect_args = build_async_engine_args(
+            "postgresql+psycopg2://u:p@db:5432/revenue?sslmode=require")
+        assert _query(url) == {'ssl': 'require'}
+        assert connect_args == {}
+
+    @pytest.mark.parametrize('mode', ['require', 'REQUIRED', 'verify-full', 'VERIFY_IDENTITY'])
+    def test_mysql_encrypted_modes_use_ssl_context(self, mode):
+        """Test encrypting MySQL modes keep TLS through an SSL context"""
+        url, connect_args = build_async_engine_args(
+            f"mysql+pymysql://u:p@db:3306/revenue?ssl_mode={mode}")
+        assert url == "mysql+aiomysql://u:p@db:3306/revenue"
+        assert isinstance(connect_args['ssl'], ssl.SSLContext)
+        assert connect_args['ssl'].check_hostname
+        assert connect_args['ssl'].verify_mode == ssl.CERT_REQUIRED
+
+    def test_mysql_verify_ca_skips_hostname_check(self):
+        """Test verify-ca verifies the certificate but not the hostname"""
+        _, connect_args = build_async_engine_args(
+            "mysql+pymysql://u:p@db:3306/revenue?ssl_mode=verify-ca")
+        assert not connect_args['ssl'].check_hostname
+        assert connect_args['ssl'].verify_mode == ssl.CERT_REQUIRED
+
+    @pytest.mark.parametrize('mode', ['prefer', 'disable'])
+    def test_mysql_optional_modes_without_context(self, mode):
+        """Test non-encrypting MySQL modes add no SSL context"""
+        _, connect_args = build_async_engine_args(
+            f"mysql+pymysql://u:p@db:3306/revenue?ssl_mode={mode}")
+        assert connect_args == {}
+
+    def test_other_query_parameters_kept(self):
+        """Test parameters other than the SSL mode are preserved"""
+        url, _ = build_async_engine_args(
+            "mysql+pymysql://u:p@db:3306/revenue?charset=utf8mb4&ssl_mode=require&connect_timeout=10")
+        assert _query(url) == {'charset': 'utf8mb4', 'connect_timeout': '10'}
+
+    def test_unsupported_driver(self):
+        """Test unknown drivers raise ValueError"""
+        with pytest.raises(ValueError, match="Unsupported database driver"):
+            build_async_engine_args("sqlite:///revenue.db")
+
+    def test_unsupported_ssl_mode(self):
+        """Test unknown SSL modes are refused instead of downgraded"""
+        with pytest.raises(ValueError, match="Unsupported SSL mode"):
+            build_async_engine_args("mysql+pymysql://u:p@db:3306/revenue?ssl_mode=bogus")
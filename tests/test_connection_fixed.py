@@ -4,6 +4,7 @@ Tests the DatabaseManager class and related functionality
 """
 
 import os
+import asyncio
 import pytest
 import unittest.mock as mock
 from unittest.mock import patch, MagicMock
@@ -220,6 +221,50 @@ class TestDatabaseManager:
                     mock_logger.warning.assert_called()
 
 
+class TestAsyncDatabaseManager:
+    """Test cases for the async engine on DatabaseManager"""
+
+    @patch.dict(os.environ, {'DB_TYPE': 'mysql', 'DB_SSL_MODE': 'require',
+                             'DB_POOL_SIZE': '4', 'DB_MAX_OVERFLOW': '2'})
+    @patch('database.connection_fixed.create_async_engine')
+    @patch('database.connection_fixed.async_sessionmaker')
+    def test_init_async_db_keeps_tls(self, mock_sessionmaker, mock_create_async_engine):
+        """Test the async MySQL engine keeps TLS and the pool settings"""
+        mock_engine = MagicMock()
+        mock_engine.connect.return_value.__aenter__.return_value = mock.AsyncMock()
+        mock_create_async_engine.return_value = mock_engine
+
+        manager = DatabaseManager()
+        asyncio.run(manager.init_async_db())
+
+        args, kwargs = mock_create_async_engine.call_args
+        assert args[0].startswith("mysql+aiomysql://")
+        assert 'ssl' in kwargs['connect_args']
+        assert kwargs['pool_size'] == 4
+        assert kwargs['max_overflow'] == 2
+        assert kwargs['pool_pre_ping'] is True
+        assert kwargs['pool_use_lifo'] is True
+        assert manager.async_engine == mock_engine
+        assert manager.AsyncSessionLocal == mock_sessionmaker.return_value
+
+    def test_get_async_db_without_init(self):
+        """Test get_async_db without initialization raises error"""
+        manager = DatabaseManager()
+
+        async def use_session():
+            async with manager.get_async_db():
+                pass
+
+        with pytest.raises(RuntimeError, match="Async database not initialized"):
+            asyncio.run(use_session())
+
+    def test_create_tables_async_without_init(self):
+        """Test create_tables_async without initialization raises error"""
+        manager = DatabaseManager()
+        with pytest.raises(RuntimeError, match="Async database not initialized"):
+            asyncio.run(manager.create_tables_async())
+
+
 class TestIntegrationScenarios:
     """Integration test scenarios"""
 